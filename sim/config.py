@@ -4,6 +4,9 @@ Port of src/core/Config.h and globals.h structures.
 """
 
 from __future__ import annotations
+import hashlib
+from bisect import insort
+from collections import deque
 from dataclasses import dataclass, field
 
 MC_PACKET_ID_CACHE = 32
@@ -32,7 +35,7 @@ class NodeConfig:
     repeat_enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     rx_count: int = 0
     tx_count: int = 0
@@ -42,7 +45,7 @@ class Stats:
     adv_rx_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SeenNode:
     hash: int = 0
     last_rssi: int = 0
@@ -55,87 +58,130 @@ class SeenNode:
 class SeenNodesTracker:
     """Tracks seen nodes, max MC_MAX_SEEN_NODES entries."""
 
+    __slots__ = ('nodes', '_by_hash', '_last_seen')
+
     def __init__(self):
         self.nodes: list[SeenNode] = []
+        # hash -> SeenNode index for O(1) lookup; `nodes` keeps slot order.
+        self._by_hash: dict[int, int] = {}
+        # last_seen column parallel to `nodes`, so eviction is a C-level min
+        self._last_seen: list[int] = []
 
     def update(self, hash_val: int, rssi: int, snr: int,
                name: str | None = None, now_ms: int = 0) -> bool:
         """Update or add node. Returns True if new node."""
-        for n in self.nodes:
-            if n.hash == hash_val:
-                n.last_rssi = rssi
-                n.last_snr = snr
-                n.pkt_count += 1
-                n.last_seen = now_ms
-                if name:
-                    n.name = name
-                return False
+        i = self._by_hash.get(hash_val)
+        if i is not None:
+            n = self.nodes[i]
+            n.last_rssi = rssi
+            n.last_snr = snr
+            n.pkt_count += 1
+            n.last_seen = now_ms
+            self._last_seen[i] = now_ms
+            if name:
+                n.name = name
+            return False
 
         node = SeenNode(
             hash=hash_val, last_rssi=rssi, last_snr=snr,
             pkt_count=1, last_seen=now_ms, name=name or ""
         )
         if len(self.nodes) < MC_MAX_SEEN_NODES:
+            self._by_hash[hash_val] = len(self.nodes)
             self.nodes.append(node)
+            self._last_seen.append(now_ms)
         else:
-            # Evict oldest
-            oldest_idx = 0
-            oldest_seen = self.nodes[0].last_seen
-            for i, n in enumerate(self.nodes):
-                if n.last_seen < oldest_seen:
-                    oldest_seen = n.last_seen
-                    oldest_idx = i
+            # Evict oldest (first on ties)
+            oldest_idx = self._last_seen.index(min(self._last_seen))
+            del self._by_hash[self.nodes[oldest_idx].hash]
+            self._by_hash[hash_val] = oldest_idx
             self.nodes[oldest_idx] = node
+            self._last_seen[oldest_idx] = now_ms
         return True
 
+    def update_many(self, hash_vals, rssi: int, snr: int, now_ms: int = 0) -> int:
+        """Update or add every node seen on one packet (a repeated hash
+        counts once). Returns the number of new nodes."""
+        update = self.update
+        new = 0
+        done: list[int] = []
+        for hash_val in hash_vals:
+            if hash_val not in done:
+                done.append(hash_val)
+                new += update(hash_val, rssi, snr, now_ms=now_ms)
+        return new
+
     def get_by_hash(self, hash_val: int) -> SeenNode | None:
-        for n in self.nodes:
-            if n.hash == hash_val:
-                return n
-        return None
+        i = self._by_hash.get(hash_val)
+        return None if i is None else self.nodes[i]
 
     def clear(self):
         self.nodes.clear()
+        self._by_hash.clear()
+        self._last_seen.clear()
 
 
 class PacketIdCache:
     """Circular buffer for packet ID deduplication."""
 
+    __slots__ = ('_ids', '_id_set', '_pos', '_size', '_wrapped')
+
     def __init__(self, size: int = MC_PACKET_ID_CACHE):
         self._ids: list[int] = [0] * size
+        self._id_set: set[int] = {0}  # O(1) membership mirror of _ids
         self._pos: int = 0
         self._size = size
+        self._wrapped: bool = False
 
     def add_if_new(self, pkt_id: int) -> bool:
         """Add ID if not already in cache. Returns True if new (added)."""
-        if pkt_id in self._ids:
+        if pkt_id in self._id_set:
             return False
+        # Zero-filled slots all share one set entry: drop it only with the last one
+        if self._wrapped or self._pos == self._size - 1:
+            self._id_set.discard(self._ids[self._pos])
         self._ids[self._pos] = pkt_id
+        self._id_set.add(pkt_id)
         self._pos = (self._pos + 1) % self._size
+        if self._pos == 0:
+            self._wrapped = True
         return True
 
     def clear(self):
         self._ids = [0] * self._size
+        self._id_set = {0}
         self._pos = 0
+        self._wrapped = False
 
 
 class TxQueue:
-    """TX queue with max size."""
+    """TX queue with max size.
+
+    The queue takes ownership of added packets (no defensive copy):
+    callers must not mutate a packet after add(). Every caller builds
+    a fresh packet (or copies one, as the forwarder does) per enqueue.
+    """
+
+    __slots__ = ('_queue', '_max_size')
 
     def __init__(self, max_size: int = MC_TX_QUEUE_SIZE):
-        self._queue: list = []
+        self._queue: deque = deque()
         self._max_size = max_size
 
     def add(self, pkt) -> bool:
         if len(self._queue) >= self._max_size:
             return False
-        self._queue.append(pkt.copy())
+        self._queue.append(pkt)
         return True
 
     def pop(self):
-        if self._queue:
-            return self._queue.pop(0)
-        return None
+        return self._queue.popleft() if self._queue else None
+
+    def drain(self) -> list:
+        """Remove and return all queued packets, oldest first."""
+        packets = list(self._queue)
+        self._queue.clear()
+        return packets
 
     @property
     def count(self) -> int:
@@ -151,11 +197,12 @@ MAILBOX_TTL_SEC = 86400 # 24 hours
 HEALTH_OFFLINE_MS = 1_800_000  # 30 minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class MailboxSlot:
     dest_hash: int = 0
     timestamp: int = 0
     pkt_data: bytes = b""   # raw serialized packet
+    digest: bytes = b""     # short hash of pkt_data (see Mailbox._digest_index)
 
     @property
     def is_empty(self) -> bool:
@@ -165,86 +212,114 @@ class MailboxSlot:
         self.dest_hash = 0
         self.timestamp = 0
         self.pkt_data = b""
+        self.digest = b""
+
+
+def _mailbox_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=8).digest()
 
 
 class Mailbox:
     """Store-and-forward mailbox. Port of src/mesh/Mailbox.h"""
 
+    __slots__ = ('eeprom_slots', 'ram_slots', '_slots', '_digest_index', '_by_dest')
+
     def __init__(self):
         self.eeprom_slots = [MailboxSlot() for _ in range(MAILBOX_SLOTS)]
         self.ram_slots = [MailboxSlot() for _ in range(MAILBOX_RAM_SLOTS)]
+        self._slots = self.eeprom_slots + self.ram_slots  # EEPROM first
+        self._digest_index: set[bytes] = set()  # digests of occupied slots
+        # dest_hash -> occupied slot indices into _slots, ascending (EEPROM first)
+        self._by_dest: dict[int, list[int]] = {}
 
     def _all_slots(self) -> list[MailboxSlot]:
-        return self.eeprom_slots + self.ram_slots
+        return self._slots
+
+    def _fill_slot(self, i: int, dest_hash: int, pkt_data: bytes,
+                   unix_time: int, digest: bytes):
+        s = self._slots[i]
+        if not s.is_empty:
+            self._unindex(i, s)
+        s.dest_hash = dest_hash
+        s.timestamp = unix_time
+        s.pkt_data = pkt_data
+        s.digest = digest
+        self._digest_index.add(digest)
+        insort(self._by_dest.setdefault(dest_hash, []), i)
+
+    def _clear_slot(self, i: int):
+        s = self._slots[i]
+        if not s.is_empty:
+            self._unindex(i, s)
+        s.clear()
+
+    def _unindex(self, i: int, s: MailboxSlot):
+        self._digest_index.discard(s.digest)
+        idxs = self._by_dest[s.dest_hash]
+        idxs.remove(i)
+        if not idxs:
+            del self._by_dest[s.dest_hash]
 
     def is_duplicate(self, data: bytes) -> bool:
-        for s in self._all_slots():
-            if not s.is_empty and s.pkt_data == data:
-                return True
-        return False
+        return _mailbox_digest(data) in self._digest_index
 
     def store(self, dest_hash: int, pkt_data: bytes, unix_time: int) -> bool:
         """Store serialized packet for offline node. Returns True if stored."""
         if len(pkt_data) == 0:
             return False
-        if self.is_duplicate(pkt_data):
+        digest = _mailbox_digest(pkt_data)
+        if digest in self._digest_index:
             return False
 
-        # Try EEPROM first
-        for s in self.eeprom_slots:
+        # Try EEPROM first, then RAM overflow
+        for i, s in enumerate(self._slots):
             if s.is_empty:
-                s.dest_hash = dest_hash
-                s.timestamp = unix_time
-                s.pkt_data = pkt_data
-                return True
-
-        # Try RAM overflow
-        for s in self.ram_slots:
-            if s.is_empty:
-                s.dest_hash = dest_hash
-                s.timestamp = unix_time
-                s.pkt_data = pkt_data
+                self._fill_slot(i, dest_hash, pkt_data, unix_time, digest)
                 return True
 
         # All full - overwrite oldest across RAM slots only
-        oldest = min(self.ram_slots, key=lambda s: s.timestamp)
-        oldest.dest_hash = dest_hash
-        oldest.timestamp = unix_time
-        oldest.pkt_data = pkt_data
+        oldest = min(range(MAILBOX_SLOTS, len(self._slots)),
+                     key=lambda i: self._slots[i].timestamp)
+        self._fill_slot(oldest, dest_hash, pkt_data, unix_time, digest)
         return True
 
     def count_for(self, dest_hash: int) -> int:
-        return sum(1 for s in self._all_slots()
-                   if not s.is_empty and s.dest_hash == dest_hash)
+        return len(self._by_dest.get(dest_hash, ()))
 
     def pop_for(self, dest_hash: int):
         """Retrieve and remove one message. EEPROM first, then RAM. Returns bytes or None."""
-        for s in self.eeprom_slots + self.ram_slots:
-            if not s.is_empty and s.dest_hash == dest_hash:
-                data = s.pkt_data
-                s.clear()
-                return data
-        return None
+        idxs = self._by_dest.get(dest_hash)
+        if not idxs:
+            return None
+        i = idxs[0]
+        data = self._slots[i].pkt_data
+        self._clear_slot(i)
+        return data
 
     def expire_old(self, current_unix_time: int):
-        for s in self._all_slots():
+        for i, s in enumerate(self._slots):
             if not s.is_empty and (current_unix_time - s.timestamp) > MAILBOX_TTL_SEC:
-                s.clear()
+                self._clear_slot(i)
 
     def get_count(self) -> int:
-        return sum(1 for s in self._all_slots() if not s.is_empty)
+        return sum(1 for s in self._slots if not s.is_empty)
 
     def get_total_slots(self) -> int:
         return MAILBOX_SLOTS + MAILBOX_RAM_SLOTS
 
     def clear(self):
-        for s in self._all_slots():
+        for s in self._slots:
             s.clear()
+        self._digest_index.clear()
+        self._by_dest.clear()
 
 
 class RateLimiter:
     """Generic sliding window rate limiter. Port of firmware RateLimiter."""
 
+    __slots__ = ('window_start', 'window_secs', 'max_count', 'count',
+                 'total_blocked', 'total_allowed')
+
     def __init__(self, max_count: int, window_secs: int):
         self.window_start: int = 0
         self.window_secs: int = window_secs
@@ -254,14 +329,18 @@ class RateLimiter:
         self.total_allowed: int = 0
 
     def allow(self, now_secs: int) -> bool:
+        # Hot path: inside the current window
         if now_secs < self.window_start + self.window_secs:
-            self.count += 1
-            if self.count > self.max_count:
+            count = self.count + 1
+            self.count = count
+            if count > self.max_count:
                 self.total_blocked += 1
                 return False
-        else:
-            self.window_start = now_secs
-            self.count = 1
+            self.total_allowed += 1
+            return True
+        # Window expired: start a new one
+        self.window_start = now_secs
+        self.count = 1
         self.total_allowed += 1
         return True
 
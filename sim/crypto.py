@@ -6,6 +6,7 @@ Port of src/mesh/Crypto.h using pycryptodome.
 from __future__ import annotations
 import hmac
 import hashlib
+from functools import lru_cache
 from Crypto.Cipher import AES
 
 MC_AES_KEY_SIZE = 16
@@ -13,19 +14,44 @@ MC_AES_BLOCK_SIZE = 16
 MC_CIPHER_MAC_SIZE = 2
 MC_SHARED_SECRET_SIZE = 32
 
+# Sim-only speed switch: keyed BLAKE2b instead of HMAC-SHA256 for the 2-byte MAC.
+# NOT wire-compatible with MeshCore firmware - leave False unless nodes only
+# talk to other simulated nodes (e.g. large scenario benchmarks).
+USE_BLAKE2_MAC = False
+
 
 def _zero_pad(data: bytes) -> bytes:
     """Pad data to AES block boundary with zeros."""
     padded_len = ((len(data) + MC_AES_BLOCK_SIZE - 1) // MC_AES_BLOCK_SIZE) * MC_AES_BLOCK_SIZE
     if padded_len == 0:
         padded_len = MC_AES_BLOCK_SIZE
+    # bytes.ljust is a single C call that returns data itself when already
+    # aligned; a bytearray(padded_len) + slice fill measured ~5x slower.
     return data.ljust(padded_len, b'\x00')
 
 
+@lru_cache(maxsize=64)
+def _ecb_cipher(aes_key: bytes):
+    """Cached AES-128-ECB cipher object. ECB keeps no state between calls,
+    so one object per key serves every encrypt/decrypt."""
+    return AES.new(aes_key, AES.MODE_ECB)
+
+
+@lru_cache(maxsize=64)
+def _hmac_template(key: bytes):
+    """Keyed HMAC-SHA256 state (inner/outer pads already absorbed).
+    copy() it per message instead of re-deriving the key schedule."""
+    return hmac.new(key, None, hashlib.sha256)
+
+
 def compute_hmac(key: bytes, data: bytes) -> bytes:
     """HMAC-SHA256 truncated to 2 bytes (MeshCore CIPHER_MAC_SIZE=2)."""
-    full_mac = hmac.new(key, data, hashlib.sha256).digest()
-    return full_mac[:MC_CIPHER_MAC_SIZE]
+    if USE_BLAKE2_MAC:
+        return hashlib.blake2b(data, key=key[:MC_SHARED_SECRET_SIZE],
+                               digest_size=MC_CIPHER_MAC_SIZE).digest()
+    h = _hmac_template(bytes(key)).copy()
+    h.update(data)
+    return h.digest()[:MC_CIPHER_MAC_SIZE]
 
 
 def verify_hmac(mac: bytes, key: bytes, data: bytes) -> bool:
@@ -36,15 +62,13 @@ def verify_hmac(mac: bytes, key: bytes, data: bytes) -> bool:
 
 def encrypt_ecb(plaintext: bytes, key: bytes) -> bytes:
     """AES-128-ECB encrypt (block by block, no chaining)."""
-    cipher = AES.new(key[:MC_AES_KEY_SIZE], AES.MODE_ECB)
     padded = _zero_pad(plaintext)
-    return cipher.encrypt(padded)
+    return _ecb_cipher(bytes(key[:MC_AES_KEY_SIZE])).encrypt(padded)
 
 
 def decrypt_ecb(ciphertext: bytes, key: bytes) -> bytes:
     """AES-128-ECB decrypt."""
-    cipher = AES.new(key[:MC_AES_KEY_SIZE], AES.MODE_ECB)
-    return cipher.decrypt(ciphertext)
+    return _ecb_cipher(bytes(key[:MC_AES_KEY_SIZE])).decrypt(ciphertext)
 
 
 def encrypt_then_mac(plaintext: bytes, key: bytes, mac_key: bytes) -> bytes:
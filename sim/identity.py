@@ -24,11 +24,25 @@ class Identity:
         self._verify_key = signing_key.verify_key
         self.public_key: bytes = bytes(self._verify_key)
         self.hash: int = self.public_key[0]  # first byte
-        self.name: str = name or f"CC-{self.public_key[0]:02X}{self.public_key[1]:02X}{self.public_key[2]:02X}"
+        self.name = name or f"CC-{self.public_key[0]:02X}{self.public_key[1]:02X}{self.public_key[2]:02X}"
         self.flags: int = 0
         self.latitude: int = 0  # microdegrees (int32)
         self.longitude: int = 0  # microdegrees (int32)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        # ADVERT wire form, encoded once: UTF-8 truncated to MC_NODE_NAME_MAX-1
+        self._name_bytes = value.encode('utf-8')[:MC_NODE_NAME_MAX - 1]
+
+    @property
+    def name_bytes(self) -> bytes:
+        return self._name_bytes
+
     def sign(self, data: bytes) -> bytes:
         """Sign data, return 64-byte Ed25519 signature."""
         signed = self._signing_key.sign(data)
@@ -48,7 +48,7 @@ def run_scenario(name: str):
 
     # Print last logs
     print("\n=== Recent Events ===")
-    for ev in runner.events[-30:]:
+    for ev in list(runner.events)[-30:]:
         if ev['type'] == 'log':
             print(f"  [{ev['ts']:>8}ms] {ev['node']:10s} {ev['msg']}")
 
@@ -4,16 +4,21 @@ Port of the logic in src/main.cpp.
 """
 
 from __future__ import annotations
+import random
+import struct
+from collections import deque
+from dataclasses import dataclass
 from sim.clock import VirtualClock
 from sim.packet import (
-    MCPacket, MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_ADVERT,
+    MCPacket, MC_ROUTE_FLOOD, MC_ROUTE_TRANSPORT_FLOOD, MC_ROUTE_DIRECT,
+    MC_ROUTE_TRANSPORT_DIRECT, MC_PAYLOAD_PLAIN, MC_PAYLOAD_ADVERT,
     MC_PAYLOAD_ANON_REQ, MC_PAYLOAD_REQUEST, MC_PAYLOAD_RESPONSE,
     MC_PAYLOAD_VER_1, MC_TYPE_REPEATER, MC_TYPE_CHAT_NODE,
     MC_FLAG_HAS_NAME, MC_MAX_PATH_SIZE, payload_type_name, route_type_name,
 )
 from sim.identity import Identity
 from sim.advert import (
-    TimeSync, build_advert, parse_advert, extract_timestamp, AdvertInfo,
+    TimeSync, AdvertTemplate, build_advert, parse_advert, AdvertInfo,
 )
 from sim.config import (
     NodeConfig, Stats, SeenNodesTracker, PacketIdCache, TxQueue, RateLimiter,
@@ -46,20 +51,52 @@ TAG_OK = "[OK]"
 TAG_ERROR = "[E]"
 TAG_INFO = "[I]"
 
+# Fixed log lines, formatted once instead of per call
+_MSG_NEW_NODE = f"{TAG_NODE} New node"
+_MSG_RATE_LIM = f"{TAG_FWD} Rate lim"
+
 ADVERT_AFTER_SYNC_MS = 5000  # 5s delay after time sync before sending ADVERT
+LOG_HISTORY_MAX = 10_000  # entries kept in SimNode.log_history (oldest dropped)
 
 # SNR adaptive delay constants (MeshCore-style)
 MC_MIN_RSSI_FORWARD = -120  # dBm minimum RSSI to forward a packet
 
 # Delay multipliers x1000, index 0 = worst SNR (-20dB), 10 = best (+15dB)
 SNR_DELAY_TABLE = [1293, 1105, 936, 783, 645, 521, 410, 310, 220, 139, 65]
+# calc_snr_score() flattened over the clamped SNR*4 range, indexed by snr + 80
+_SNR_TO_SCORE = [i * 10 // 140 for i in range(141)]
+
+_randint = random.randint  # bound once; calc_tx_jitter runs per forward
+
+# PLAIN payload markers: [dest][src][marker:2][text]
+_M_DP = b'DP'  # directed ping
+_M_PO = b'PO'  # pong
+_M_DT = b'DT'  # directed trace
+_M_TR = b'TR'  # trace response
+# Same markers as big-endian u16, for dispatch without slicing
+_MK_DP = 0x4450
+_MK_PO = 0x504F
+_MK_DT = 0x4454
+_MK_TR = 0x5452
+_pack_hashes = struct.Struct('BB').pack  # [dest][src] header, format parsed once
+
+# Payload-type sets as bitmasks over the 4-bit type: test with (mask >> pt) & 1
+# Types carrying [dest] first - not forwarded when addressed to us
+_ADDRESSED_MASK = ((1 << MC_PAYLOAD_ANON_REQ) | (1 << MC_PAYLOAD_REQUEST) |
+                   (1 << MC_PAYLOAD_RESPONSE))
+# Types kept in the mailbox for offline destinations
+_MAILBOX_MASK = _ADDRESSED_MASK | (1 << MC_PAYLOAD_PLAIN)
+
+
+def _build_plain_payload(dest: int, src: int, marker: bytes, text: str) -> bytes:
+    """Build a PLAIN payload: [dest][src][marker][utf-8 text]."""
+    return _pack_hashes(dest, src) + marker + text.encode()
 
 
 def calc_snr_score(snr: int) -> int:
     """Map SNR (in 0.25dB units, i.e. SNR*4) to index [0-10].
     -20dB (*4=-80) -> 0, +15dB (*4=60) -> 10."""
-    clamped = max(-80, min(60, snr))
-    return (clamped + 80) * 10 // 140
+    return _SNR_TO_SCORE[max(0, min(140, snr + 80))]
 
 
 def calc_rx_delay(score_idx: int, airtime_ms: int) -> int:
@@ -71,10 +108,18 @@ def calc_rx_delay(score_idx: int, airtime_ms: int) -> int:
 
 def calc_tx_jitter(airtime_ms: int) -> int:
     """Calculate random TX jitter: 0-6 slots of 2x airtime.
-    Returns max possible jitter (deterministic for testing)."""
-    import random as _rng
-    slot_time = airtime_ms * 2
-    return _rng.randint(0, 6) * slot_time
+    Uses the global `random` state, so random.seed() makes it reproducible."""
+    return _randint(0, 6) * (airtime_ms * 2)
+
+
+@dataclass(slots=True)
+class Neighbour:
+    """Direct (0-hop) repeater neighbour, keyed by hash in SimRepeater.neighbours."""
+    hash: int
+    rssi: int
+    snr: int
+    last_seen: int
+    cb_state: int = CB_STATE_CLOSED
 
 
 class SimNode:
@@ -87,6 +132,8 @@ class SimNode:
 
         self.identity = Identity(name)
         self.identity.flags = node_type | MC_FLAG_HAS_NAME
+        self._hash: int = self.identity.hash  # fixed by the public key
+        self._advert_template = AdvertTemplate(self.identity)
 
         self.time_sync = TimeSync(clock)
         self.seen_nodes = SeenNodesTracker()
@@ -94,113 +141,145 @@ class SimNode:
         self.tx_queue = TxQueue()
         self.stats = Stats()
 
-        self.log_buffer: list[tuple[int, str]] = []  # (ms, message) - drained by runner
-        self.log_history: list[tuple[int, str]] = []  # persistent copy
+        self.log_buffer: deque[tuple[int, str]] = deque()  # (ms, message) - drained by runner
+        self.log_history: deque[tuple[int, str]] = deque(maxlen=LOG_HISTORY_MAX)  # recent copy
         self.ping_counter: int = 0
+        # Setter binds _log to _log_impl or the no-op _log_noop
+        self.verbose = True
 
         self._advert_interval_ms = DEFAULT_ADVERT_INTERVAL_MS
         self._last_advert_time: int = 0
         self._pending_advert_time: int = 0
 
-    def _log(self, msg: str):
+    @property
+    def verbose(self) -> bool:
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, enabled: bool):
+        self._verbose = enabled
+        self._log = self._log_impl if enabled else self._log_noop
+
+    def _log_impl(self, msg: str):
         entry = (self.clock.millis(), msg)
         self.log_buffer.append(entry)
         self.log_history.append(entry)
 
+    def _log_noop(self, msg: str):
+        pass
+
+    # Hot RX messages: check verbose before building the f-string, which
+    # _log_noop alone cannot skip.
+
+    def _log_advert_node(self, info: AdvertInfo):
+        if self._verbose:
+            self._log(f"{TAG_NODE} {info.name}"
+                      f"{' R' if info.is_repeater else ''}"
+                      f"{' C' if info.is_chat_node else ''}"
+                      f" {info.pub_key_hash:02X}")
+
+    def _log_plain_rx(self, label: str, src_hash: int, p: bytes):
+        if self._verbose:
+            text = p[4:].decode('utf-8', errors='replace')
+            self._log(f"{TAG_PING} {label} {src_hash:02X} {text}")
+
+    def _log_plain_reply(self, label: str, src_hash: int, p: bytes, pkt: MCPacket):
+        if self._verbose:
+            text = p[4:].decode('utf-8', errors='replace')
+            self._log(f"{TAG_PING} {label} {src_hash:02X} {text} rssi={pkt.rssi} "
+                      f"snr={pkt.snr // 4}.{abs(pkt.snr % 4) * 25}dB p={pkt.path_len}")
+
     # --- Packet reception dispatch ---
 
-    def on_rx_packet(self, pkt: MCPacket, rssi: int, snr: int):
-        """Process a received packet. Port of processReceivedPacket()."""
+    def on_rx_packet(self, pkt: MCPacket, rssi: int, snr: int) -> AdvertInfo | None:
+        """Process a received packet. Port of processReceivedPacket().
+
+        Returns the parsed AdvertInfo for ADVERT packets so subclasses
+        do not parse the payload again.
+        """
+        now = self.clock.millis()
         pkt.rssi = rssi
         pkt.snr = snr
-        pkt.rx_time = self.clock.millis()
+        pkt.rx_time = now
         self.stats.rx_count += 1
 
         pt = pkt.payload_type
+        info = None
 
         if pt == MC_PAYLOAD_ADVERT:
-            self._process_advert(pkt)
+            info = self._process_advert(pkt, now)
         elif pt == MC_PAYLOAD_PLAIN:
             self._process_plain(pkt)
 
-        # Track nodes from path
-        if pkt.path_len > 0:
-            self.seen_nodes.update(
-                pkt.path[0], rssi, snr, now_ms=self.clock.millis()
-            )
-            if pkt.path_len > 1:
-                last_hop = pkt.path[-1]
-                if last_hop != pkt.path[0]:
-                    self.seen_nodes.update(last_hop, rssi, snr, now_ms=self.clock.millis())
+        # Track nodes from path: origin and last hop
+        path = pkt.path
+        if path:
+            self.seen_nodes.update_many((path[0], path[-1]), rssi, snr, now_ms=now)
+        return info
 
-    def _process_advert(self, pkt: MCPacket):
-        """Process ADVERT packet."""
+    def _process_advert(self, pkt: MCPacket, now_ms: int,
+                        info: AdvertInfo | None = None) -> AdvertInfo | None:
+        """Process ADVERT packet. Returns the parsed AdvertInfo (or None)."""
         self.stats.adv_rx_count += 1
 
-        advert_time = extract_timestamp(pkt.payload)
+        if info is None:
+            info = parse_advert(pkt.payload)
+        advert_time = info.timestamp if info else 0
         if advert_time > 0:
             sync_result = self.time_sync.sync_from_advert(advert_time)
             if sync_result == 1:
                 self._log(f"{TAG_OK} Time sync {self.time_sync.get_timestamp()}")
-                self._pending_advert_time = self.clock.millis() + ADVERT_AFTER_SYNC_MS
+                self._pending_advert_time = now_ms + ADVERT_AFTER_SYNC_MS
             elif sync_result == 2:
                 self._log(f"{TAG_OK} Time resync {self.time_sync.get_timestamp()}")
-                self._pending_advert_time = self.clock.millis() + ADVERT_AFTER_SYNC_MS
+                self._pending_advert_time = now_ms + ADVERT_AFTER_SYNC_MS
 
-        info = parse_advert(pkt.payload)
         if info:
-            self._log(f"{TAG_NODE} {info.name}"
-                       f"{' R' if info.is_repeater else ''}"
-                       f"{' C' if info.is_chat_node else ''}"
-                       f" {info.pub_key_hash:02X}")
+            self._log_advert_node(info)
             is_new = self.seen_nodes.update(
                 info.pub_key_hash, pkt.rssi, pkt.snr,
-                name=info.name, now_ms=self.clock.millis()
+                name=info.name, now_ms=now_ms
             )
             if is_new:
-                self._log(f"{TAG_NODE} New node")
+                self._log(_MSG_NEW_NODE)
+        return info
 
     def _process_plain(self, pkt: MCPacket):
         """Process PLAIN packet - directed ping/pong/trace."""
         if pkt.payload_len < 4:
             return
 
-        dest_hash = pkt.payload[0]
-        src_hash = pkt.payload[1]
-        marker = pkt.payload[2:4]
-
-        my_hash = self.identity.hash
+        p = pkt.payload
+        dest_hash = p[0]
+        if dest_hash != self._hash:
+            return
+        src_hash = p[1]
+        mk = (p[2] << 8) | p[3]
 
-        if marker == b'DP' and dest_hash == my_hash:
+        if mk == _MK_DP:
             # Directed PING for us
-            text = pkt.payload[4:].decode('utf-8', errors='replace') if pkt.payload_len > 4 else ""
-            self._log(f"{TAG_PING} from {src_hash:02X} {text}")
+            self._log_plain_rx("from", src_hash, p)
             self._send_pong(src_hash, pkt)
 
-        elif marker == b'PO' and dest_hash == my_hash:
+        elif mk == _MK_PO:
             # PONG for us
-            text = pkt.payload[4:].decode('utf-8', errors='replace') if pkt.payload_len > 4 else ""
-            self._log(f"{TAG_PING} PONG {src_hash:02X} {text} rssi={pkt.rssi} "
-                       f"snr={pkt.snr // 4}.{abs(pkt.snr % 4) * 25}dB p={pkt.path_len}")
+            self._log_plain_reply("PONG", src_hash, p, pkt)
 
-        elif marker == b'DT' and dest_hash == my_hash:
+        elif mk == _MK_DT:
             # Directed TRACE for us
-            text = pkt.payload[4:].decode('utf-8', errors='replace') if pkt.payload_len > 4 else ""
-            self._log(f"{TAG_PING} TRACE from {src_hash:02X} {text}")
+            self._log_plain_rx("TRACE from", src_hash, p)
             self._send_trace_response(src_hash, pkt)
 
-        elif marker == b'TR' and dest_hash == my_hash:
+        elif mk == _MK_TR:
             # Trace response for us
-            text = pkt.payload[4:].decode('utf-8', errors='replace') if pkt.payload_len > 4 else ""
-            self._log(f"{TAG_PING} TRACE {src_hash:02X} {text} rssi={pkt.rssi} "
-                       f"snr={pkt.snr // 4}.{abs(pkt.snr % 4) * 25}dB p={pkt.path_len}")
+            self._log_plain_reply("TRACE", src_hash, p, pkt)
 
     # --- TX helpers ---
 
     def send_advert(self, flood: bool = True):
         """Build and enqueue ADVERT."""
         route = MC_ROUTE_FLOOD if flood else 0x02  # DIRECT for zero-hop
-        pkt = build_advert(self.identity, self.time_sync, route)
+        pkt = build_advert(self.identity, self.time_sync, route, self._advert_template)
 
         pkt_id = pkt.get_packet_id()
         self.packet_cache.add_if_new(pkt_id)
@@ -215,11 +294,11 @@ class SimNode:
         """Send directed ping DP."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.identity.hash]
+        pkt.path = bytearray((self._hash,))
 
         self.ping_counter += 1
         text = f"#{self.ping_counter} {self.identity.name}"
-        pkt.payload = bytes([target_hash, self.identity.hash, ord('D'), ord('P')]) + text.encode()
+        pkt.payload = _build_plain_payload(target_hash, self._hash, _M_DP, text)
 
         self._log(f"{TAG_PING} -> {target_hash:02X} #{self.ping_counter}")
 
@@ -232,11 +311,11 @@ class SimNode:
         """Send directed trace DT."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.identity.hash]
+        pkt.path = bytearray((self._hash,))
 
         self.ping_counter += 1
         text = f"#{self.ping_counter} {self.identity.name}"
-        pkt.payload = bytes([target_hash, self.identity.hash, ord('D'), ord('T')]) + text.encode()
+        pkt.payload = _build_plain_payload(target_hash, self._hash, _M_DT, text)
 
         self._log(f"{TAG_PING} ~> {target_hash:02X} #{self.ping_counter}")
 
@@ -249,10 +328,10 @@ class SimNode:
         """Send PONG response."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.identity.hash]
+        pkt.path = bytearray((self._hash,))
 
         text = f"{self.identity.name} {rx_pkt.rssi}"
-        pkt.payload = bytes([target_hash, self.identity.hash, ord('P'), ord('O')]) + text.encode()
+        pkt.payload = _build_plain_payload(target_hash, self._hash, _M_PO, text)
 
         self._log(f"{TAG_PING} PONG -> {target_hash:02X}")
 
@@ -265,10 +344,10 @@ class SimNode:
         """Send trace response TR."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.identity.hash]
+        pkt.path = bytearray((self._hash,))
 
         text = f"{self.identity.name} {rx_pkt.rssi} {rx_pkt.path_len}"
-        pkt.payload = bytes([target_hash, self.identity.hash, ord('T'), ord('R')]) + text.encode()
+        pkt.payload = _build_plain_payload(target_hash, self._hash, _M_TR, text)
 
         self._log(f"{TAG_PING} TR -> {target_hash:02X}")
 
@@ -294,12 +373,7 @@ class SimNode:
             self.send_advert(True)
 
         # Drain TX queue
-        packets = []
-        while self.tx_queue.count > 0:
-            pkt = self.tx_queue.pop()
-            if pkt:
-                packets.append(pkt)
-        return packets
+        return self.tx_queue.drain()
 
 
 class SimRepeater(SimNode):
@@ -309,7 +383,8 @@ class SimRepeater(SimNode):
         super().__init__(name, MC_TYPE_REPEATER, clock)
         self.config = NodeConfig()
         self.forward_limiter = RateLimiter(RATE_LIMIT_FORWARD_MAX, RATE_LIMIT_FORWARD_SECS)
-        self.neighbours: list[dict] = []  # [{hash, rssi, snr, last_seen, cb_state}]
+        self.neighbours: dict[int, Neighbour] = {}  # hash -> Neighbour
+        self._snr_sum: int = 0  # running sum of neighbour SNR, for adaptive TX
         self.mailbox = Mailbox()
 
         # Quiet Hours
@@ -322,26 +397,29 @@ class SimRepeater(SimNode):
         # Adaptive TX Power
         self.current_tx_power: int = DEFAULT_TX_POWER
         self.max_tx_power: int = DEFAULT_TX_POWER
-        self.adaptive_tx_enabled: bool = False
         self._last_adaptive_eval: int = 0
+        # Setter binds the 60s maintenance steps (see _rebuild_periodic)
+        self.adaptive_tx_enabled = False
 
     def on_rx_packet(self, pkt: MCPacket, rssi: int, snr: int):
         """Process received packet + forwarding logic."""
-        # First do base processing
-        super().on_rx_packet(pkt, rssi, snr)
+        # First do base processing (parses ADVERTs once for us)
+        info = super().on_rx_packet(pkt, rssi, snr)
 
-        # Track neighbours from 0-hop ADVERTs
-        if pkt.payload_type == MC_PAYLOAD_ADVERT and pkt.path_len == 0:
-            info = parse_advert(pkt.payload)
-            if info and info.is_repeater:
-                self._update_neighbour(info.pub_key_hash, rssi, snr)
+        now = pkt.rx_time
+        pt = pkt.payload_type
+        identity_hash = self._hash
 
-        # Store-and-forward: deliver pending messages when node comes back
-        if pkt.payload_type == MC_PAYLOAD_ADVERT:
-            info = parse_advert(pkt.payload)
-            if info and self.mailbox.count_for(info.pub_key_hash) > 0:
+        if info:
+            # Track neighbours from 0-hop ADVERTs
+            if info.is_repeater and pkt.path_len == 0:
+                self._update_neighbour(info.pub_key_hash, rssi, snr, now_ms=now)
+
+            # Store-and-forward: deliver pending messages when node comes back
+            mailbox = self.mailbox
+            if mailbox.count_for(info.pub_key_hash) > 0:
                 while True:
-                    data = self.mailbox.pop_for(info.pub_key_hash)
+                    data = mailbox.pop_for(info.pub_key_hash)
                     if data is None:
                         break
                     fwd_pkt = MCPacket()
@@ -350,56 +428,80 @@ class SimRepeater(SimNode):
                         self._log(f"{TAG_INFO} Mbox fwd {info.pub_key_hash:02X}")
 
         # Store-and-forward: save packets for offline nodes
-        pt = pkt.payload_type
-        if (pkt.payload_len >= 2 and
-                pt in (MC_PAYLOAD_REQUEST, MC_PAYLOAD_RESPONSE,
-                       MC_PAYLOAD_PLAIN, MC_PAYLOAD_ANON_REQ)):
+        if pkt.payload_len >= 2 and (_MAILBOX_MASK >> pt) & 1:
             dest_hash = pkt.payload[0]
-            if dest_hash != self.identity.hash and dest_hash != 0:
+            if dest_hash != identity_hash and dest_hash != 0:
                 sn = self.seen_nodes.get_by_hash(dest_hash)
                 if (sn and sn.pkt_count >= 2 and
-                        (self.clock.millis() - sn.last_seen) > HEALTH_OFFLINE_MS):
-                    if self.time_sync.is_synchronized():
+                        (now - sn.last_seen) > HEALTH_OFFLINE_MS):
+                    time_sync = self.time_sync
+                    if time_sync.is_synchronized():
                         serialized = pkt.serialize()
                         if self.mailbox.store(dest_hash, serialized,
-                                              self.time_sync.get_timestamp()):
+                                              time_sync.get_timestamp()):
                             self._log(f"{TAG_INFO} Mbox store {dest_hash:02X}")
 
         # Forwarding logic
         if self._should_forward(pkt):
-            now_secs = self.clock.millis() // 1000
+            now_secs = now // 1000
             if not self.forward_limiter.allow(now_secs):
-                self._log(f"{TAG_FWD} Rate lim")
+                self._log(_MSG_RATE_LIM)
                 return
 
             fwd_pkt = pkt.copy()
-            # Compute SNR adaptive delay (logged, not enforced in sim)
+            path = fwd_pkt.path
+            # Compute SNR adaptive delay (logged, not enforced in sim).
+            # Always computed so the jitter draw does not depend on verbose.
             airtime_est = 200  # default airtime estimate in ms
             if fwd_pkt.is_direct():
                 # Circuit breaker: check next hop before peel
-                if fwd_pkt.path_len >= 2:
-                    next_hop = fwd_pkt.path[1]
+                if len(path) >= 2:
+                    next_hop = path[1]
                     if self._is_circuit_open(next_hop):
-                        self._log(f"{TAG_FWD} CB {next_hop:02X}")
+                        self._log_fwd_cb(next_hop)
                         return
                 # DIRECT: remove ourselves from path[0] (peel)
-                fwd_pkt.path = fwd_pkt.path[1:]
+                fwd_pkt.path = path = path[1:]
                 fwd_delay = calc_tx_jitter(airtime_est) // 2
-                self._log(f"{TAG_FWD} Direct p={fwd_pkt.path_len} d={fwd_delay}ms")
+                self._log_fwd_direct(len(path), fwd_delay)
             else:
                 # FLOOD: add our hash to path
-                fwd_pkt.path.append(self.identity.hash)
+                path.append(identity_hash)
+                fwd_pkt.invalidate_packet_id()  # in-place edit, setter not hit
                 score = calc_snr_score(pkt.snr)
                 fwd_delay = calc_rx_delay(score, airtime_est) + calc_tx_jitter(airtime_est)
-                self._log(f"{TAG_FWD} Flood p={fwd_pkt.path_len} snr={score} d={fwd_delay}ms")
+                self._log_fwd_flood(len(path), score, fwd_delay)
             self.tx_queue.add(fwd_pkt)
             self.stats.fwd_count += 1
-            self._log(f"{TAG_FWD} Q p={fwd_pkt.path_len}")
+            self._log_fwd_queued(len(path))
+
+    # Hot forward messages, see SimNode._log_advert_node
+
+    def _log_fwd_cb(self, next_hop: int):
+        if self._verbose:
+            self._log(f"{TAG_FWD} CB {next_hop:02X}")
+
+    def _log_fwd_direct(self, path_len: int, fwd_delay: int):
+        if self._verbose:
+            self._log(f"{TAG_FWD} Direct p={path_len} d={fwd_delay}ms")
+
+    def _log_fwd_flood(self, path_len: int, score: int, fwd_delay: int):
+        if self._verbose:
+            self._log(f"{TAG_FWD} Flood p={path_len} snr={score} d={fwd_delay}ms")
+
+    def _log_fwd_queued(self, path_len: int):
+        if self._verbose:
+            self._log(f"{TAG_FWD} Q p={path_len}")
 
     def _should_forward(self, pkt: MCPacket) -> bool:
-        """Port of shouldForward(). Supports FLOOD and DIRECT routing."""
-        is_flood = pkt.is_flood()
-        is_direct = pkt.is_direct()
+        """Port of shouldForward(). Supports FLOOD and DIRECT routing.
+
+        Cheap structural rejects run first; the packet-id dedup check
+        runs last so only forwardable packets are recorded in the cache.
+        """
+        rt = pkt.route_type  # one header decode instead of two method calls
+        is_flood = rt == MC_ROUTE_FLOOD or rt == MC_ROUTE_TRANSPORT_FLOOD
+        is_direct = rt == MC_ROUTE_DIRECT or rt == MC_ROUTE_TRANSPORT_DIRECT
 
         if not is_flood and not is_direct:
             return False
@@ -408,69 +510,67 @@ class SimRepeater(SimNode):
         if pkt.rssi < MC_MIN_RSSI_FORWARD:
             return False
 
-        # DIRECT routing: check if we are the next hop (path[0] == our hash)
+        my_hash = self._hash
+        path = pkt.path
+
         if is_direct:
-            if pkt.path_len == 0:
+            # DIRECT routing: check if we are the next hop (path[0] == our hash)
+            if not path or path[0] != my_hash:
+                return False
+        else:
+            # FLOOD: loop prevention and path length check
+            if my_hash in path:
                 return False
-            if pkt.path[0] != self.identity.hash:
+            if len(path) >= MC_MAX_PATH_SIZE - 1:
                 return False
 
         # Don't forward packets addressed to us
         pt = pkt.payload_type
-        if pt in (MC_PAYLOAD_ANON_REQ, MC_PAYLOAD_REQUEST, MC_PAYLOAD_RESPONSE):
-            if pkt.payload_len > 0 and pkt.payload[0] == self.identity.hash:
+        if (_ADDRESSED_MASK >> pt) & 1:
+            payload = pkt.payload
+            if payload and payload[0] == my_hash:
                 return False
 
         # Check packet ID cache (deduplication)
-        pkt_id = pkt.get_packet_id()
-        if not self.packet_cache.add_if_new(pkt_id):
-            return False
-
-        # FLOOD: loop prevention and path length check
-        if is_flood:
-            if self.identity.hash in pkt.path:
-                return False
-            if pkt.path_len >= MC_MAX_PATH_SIZE - 1:
-                return False
-
-        return True
-
-    def _update_neighbour(self, hash_val: int, rssi: int, snr: int):
-        for n in self.neighbours:
-            if n['hash'] == hash_val:
-                n['rssi'] = rssi
-                n['snr'] = snr
-                n['last_seen'] = self.clock.millis()
-                # Circuit breaker: update state based on SNR
-                if snr < CB_SNR_THRESHOLD:
-                    if n.get('cb_state', CB_STATE_CLOSED) == CB_STATE_CLOSED:
-                        n['cb_state'] = CB_STATE_OPEN
-                elif n.get('cb_state', CB_STATE_CLOSED) != CB_STATE_CLOSED:
-                    n['cb_state'] = CB_STATE_CLOSED  # good SNR → close
-                return
-        self.neighbours.append({
-            'hash': hash_val, 'rssi': rssi, 'snr': snr,
-            'last_seen': self.clock.millis(), 'cb_state': CB_STATE_CLOSED,
-        })
+        return self.packet_cache.add_if_new(pkt.get_packet_id())
+
+    def _update_neighbour(self, hash_val: int, rssi: int, snr: int,
+                          now_ms: int | None = None):
+        now = self.clock.millis() if now_ms is None else now_ms
+        n = self.neighbours.get(hash_val)
+        if n is None:
+            self.neighbours[hash_val] = Neighbour(
+                hash=hash_val, rssi=rssi, snr=snr, last_seen=now,
+            )
+            self._snr_sum += snr
+            return
+        n.rssi = rssi
+        self._snr_sum += snr - n.snr
+        n.snr = snr
+        n.last_seen = now
+        # Circuit breaker: update state based on SNR
+        if snr < CB_SNR_THRESHOLD:
+            if n.cb_state == CB_STATE_CLOSED:
+                n.cb_state = CB_STATE_OPEN
+        elif n.cb_state != CB_STATE_CLOSED:
+            n.cb_state = CB_STATE_CLOSED  # good SNR → close
 
     # --- Circuit Breaker ---
 
     def _is_circuit_open(self, hash_val: int) -> bool:
-        for n in self.neighbours:
-            if n['hash'] == hash_val:
-                return n.get('cb_state', CB_STATE_CLOSED) == CB_STATE_OPEN
-        return False
+        n = self.neighbours.get(hash_val)
+        return n is not None and n.cb_state == CB_STATE_OPEN
 
     def get_circuit_breaker_count(self) -> int:
-        return sum(1 for n in self.neighbours
-                   if n.get('cb_state', CB_STATE_CLOSED) == CB_STATE_OPEN)
+        return sum(1 for n in self.neighbours.values()
+                   if n.cb_state == CB_STATE_OPEN)
 
-    def _tick_circuit_breakers(self):
-        now = self.clock.millis()
-        for n in self.neighbours:
-            if (n.get('cb_state', CB_STATE_CLOSED) == CB_STATE_OPEN and
-                    (now - n['last_seen']) > CB_TIMEOUT_MS):
-                n['cb_state'] = CB_STATE_HALF_OPEN
+    def _tick_circuit_breakers(self, now_ms: int | None = None):
+        now = self.clock.millis() if now_ms is None else now_ms
+        for n in self.neighbours.values():
+            if (n.cb_state == CB_STATE_OPEN and
+                    (now - n.last_seen) > CB_TIMEOUT_MS):
+                n.cb_state = CB_STATE_HALF_OPEN
 
     # --- Quiet Hours ---
 
@@ -478,12 +578,14 @@ class SimRepeater(SimNode):
         self.quiet_start_hour = start
         self.quiet_end_hour = end
         self.quiet_forward_max = max_fwd
+        self._rebuild_periodic()
 
     def disable_quiet_hours(self):
         self.quiet_start_hour = 0xFF
         self.quiet_end_hour = 0
         self._in_quiet_period = False
         self.forward_limiter.max_count = RATE_LIMIT_FORWARD_MAX
+        self._rebuild_periodic()
 
     def is_quiet_hours_enabled(self) -> bool:
         return self.quiet_start_hour != 0xFF
@@ -505,15 +607,34 @@ class SimRepeater(SimNode):
             else:
                 self.forward_limiter.max_count = RATE_LIMIT_FORWARD_MAX
 
+    def _periodic_quiet_hours(self, now_ms: int):
+        if self.time_sync.is_synchronized():
+            ts = self.time_sync.get_timestamp()
+            self._evaluate_quiet_hours((ts % 86400) // 3600)
+
     # --- Adaptive TX Power ---
 
+    @property
+    def adaptive_tx_enabled(self) -> bool:
+        return self._adaptive_tx_enabled
+
+    @adaptive_tx_enabled.setter
+    def adaptive_tx_enabled(self, enabled: bool):
+        self._adaptive_tx_enabled = enabled
+        self._rebuild_periodic()
+
+    def _periodic_adaptive_tx(self, now_ms: int):
+        new_power = self.evaluate_adaptive_tx_power()
+        if new_power >= 0:
+            self._log(f"{TAG_INFO} TxP:{new_power}dBm")
+
     def evaluate_adaptive_tx_power(self) -> int:
         """Returns new power if changed, -1 otherwise."""
-        if not self.adaptive_tx_enabled:
+        if not self._adaptive_tx_enabled:
             return -1
         if not self.neighbours:
             return -1
-        avg_snr = sum(n['snr'] for n in self.neighbours) // len(self.neighbours)
+        avg_snr = self._snr_sum // len(self.neighbours)
         old_power = self.current_tx_power
         if avg_snr > ADAPTIVE_TX_HIGH_SNR:
             self.current_tx_power -= ADAPTIVE_TX_STEP
@@ -595,6 +716,20 @@ class SimRepeater(SimNode):
         return f"{TAG_PING} ~> {h:02X}"
 
 
+    def _rebuild_periodic(self):
+        """Bind the 60s maintenance steps for the current configuration.
+
+        Called whenever quiet hours or adaptive TX are toggled, so tick()
+        runs only the enabled steps instead of re-checking each flag.
+        """
+        periodic = []
+        if self.is_quiet_hours_enabled():
+            periodic.append(self._periodic_quiet_hours)
+        periodic.append(self._tick_circuit_breakers)
+        if self._adaptive_tx_enabled:
+            periodic.append(self._periodic_adaptive_tx)
+        self._periodic = periodic
+
     def tick(self) -> list[MCPacket]:
         """Advance one tick with periodic maintenance."""
         now = self.clock.millis()
@@ -602,17 +737,8 @@ class SimRepeater(SimNode):
         # Periodic (every 60s): quiet hours, circuit breakers, adaptive TX
         if now - self._last_quiet_eval >= 60000:
             self._last_quiet_eval = now
-            # Quiet hours
-            if self.is_quiet_hours_enabled() and self.time_sync.is_synchronized():
-                ts = self.time_sync.get_timestamp()
-                hour = (ts % 86400) // 3600
-                self._evaluate_quiet_hours(hour)
-            # Circuit breaker timeouts
-            self._tick_circuit_breakers()
-            # Adaptive TX power
-            new_power = self.evaluate_adaptive_tx_power()
-            if new_power >= 0:
-                self._log(f"{TAG_INFO} TxP:{new_power}dBm")
+            for step in self._periodic:
+                step(now)
 
         return super().tick()
 
@@ -623,10 +749,10 @@ class SimCompanion(SimNode):
     def __init__(self, name: str, clock: VirtualClock):
         super().__init__(name, MC_TYPE_CHAT_NODE, clock)
 
-    def on_rx_packet(self, pkt: MCPacket, rssi: int, snr: int):
+    def on_rx_packet(self, pkt: MCPacket, rssi: int, snr: int) -> AdvertInfo | None:
         """Process received packet - NO forwarding."""
-        super().on_rx_packet(pkt, rssi, snr)
         # Companions do not forward
+        return super().on_rx_packet(pkt, rssi, snr)
 
     def process_command(self, cmd: str) -> str:
         """Limited CLI for companion."""
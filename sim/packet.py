@@ -6,6 +6,9 @@ Header byte: (route & 0x03) | ((type & 0x0F) << 2) | ((ver & 0x03) << 6)
 """
 
 from __future__ import annotations
+import struct
+
+_pack_header = struct.Struct('BB').pack  # [header][pathLen]
 
 # Maximum sizes
 MC_MAX_PACKET_SIZE = 255
@@ -104,59 +107,88 @@ def payload_type_name(pt: int) -> str:
 class MCPacket:
     """Exact port of firmware MCPacket struct."""
 
-    __slots__ = ('header', 'path', 'payload', 'rx_time', 'snr', 'rssi')
+    __slots__ = ('_header', '_path', '_payload', 'rx_time', 'snr', 'rssi', '_packet_id')
 
     def __init__(self):
-        self.header: int = 0  # raw header byte
-        self.path: list[int] = []  # list of uint8 hashes
-        self.payload: bytes = b''
+        self._header: int = 0  # raw header byte
+        self._path: bytearray = bytearray()  # uint8 hashes, one byte per hop
+        self._payload: bytes = b''
         # Metadata (not transmitted)
         self.rx_time: int = 0
         self.snr: int = 0  # SNR * 4
         self.rssi: int = 0
+        self._packet_id: int | None = None  # memoized get_packet_id()
+
+    # header/path/payload feed the packet id: assigning any of them drops
+    # the memoized id. In-place path edits (append) must call
+    # invalidate_packet_id() themselves.
+
+    @property
+    def header(self) -> int:
+        return self._header
+
+    @header.setter
+    def header(self, value: int):
+        self._header = value
+        self._packet_id = None
+
+    @property
+    def path(self) -> bytearray:
+        return self._path
+
+    @path.setter
+    def path(self, value: bytearray):
+        self._path = value
+        self._packet_id = None
+
+    @property
+    def payload(self) -> bytes:
+        return self._payload
+
+    @payload.setter
+    def payload(self, value: bytes):
+        self._payload = value
+        self._packet_id = None
 
     @property
     def route_type(self) -> int:
-        return get_route_type(self.header)
+        return get_route_type(self._header)
 
     @property
     def payload_type(self) -> int:
-        return get_payload_type(self.header)
+        return get_payload_type(self._header)
 
     @property
     def version(self) -> int:
-        return get_version(self.header)
+        return get_version(self._header)
 
     @property
     def path_len(self) -> int:
-        return len(self.path)
+        return len(self._path)
 
     @property
     def payload_len(self) -> int:
-        return len(self.payload)
+        return len(self._payload)
 
     def is_flood(self) -> bool:
-        rt = self.route_type
+        rt = get_route_type(self._header)
         return rt == MC_ROUTE_FLOOD or rt == MC_ROUTE_TRANSPORT_FLOOD
 
     def is_direct(self) -> bool:
-        rt = self.route_type
+        rt = get_route_type(self._header)
         return rt == MC_ROUTE_DIRECT or rt == MC_ROUTE_TRANSPORT_DIRECT
 
     def set_header(self, route: int, payload_type: int, version: int = 0):
-        self.header = make_header(route, payload_type, version)
+        self._header = make_header(route, payload_type, version)
+        self._packet_id = None
 
     def get_total_size(self) -> int:
-        return 1 + 1 + len(self.path) + len(self.payload)
+        return 1 + 1 + len(self._path) + len(self._payload)
 
     def serialize(self) -> bytes:
         """Serialize to wire format: [header][pathLen][path...][payload...]"""
-        buf = bytearray()
-        buf.append(self.header)
-        buf.append(len(self.path))
-        buf.extend(self.path)
-        buf.extend(self.payload)
-        return bytes(buf)
+        path = self._path
+        return b''.join((_pack_header(self._header, len(path)), path, self._payload))
 
     @staticmethod
     def deserialize(data: bytes) -> MCPacket | None:
@@ -165,7 +197,7 @@ class MCPacket:
             return None
 
         pkt = MCPacket()
-        pkt.header = data[0]
+        pkt._header = data[0]
         path_len = data[1]
 
         if path_len > MC_MAX_PATH_SIZE:
@@ -173,48 +205,63 @@ class MCPacket:
         if 2 + path_len > len(data):
             return None
 
-        pkt.path = list(data[2:2 + path_len])
+        pkt._path = bytearray(data[2:2 + path_len])
 
         payload_start = 2 + path_len
         payload_data = data[payload_start:]
         if len(payload_data) > MC_MAX_PAYLOAD_SIZE:
             payload_data = payload_data[:MC_MAX_PAYLOAD_SIZE]
-        pkt.payload = bytes(payload_data)
+        pkt._payload = bytes(payload_data)
 
         return pkt
 
     def get_packet_id(self) -> int:
-        """DJB2 hash for deduplication - exact port of firmware getPacketId()."""
-        h = 5381
-        h = ((h << 5) + h) ^ self.header
+        """DJB2 hash for deduplication - exact port of firmware getPacketId().
+
+        The id is memoized and carried over by copy(). Assigning header,
+        path or payload drops it; in-place path edits must call
+        invalidate_packet_id().
+        """
+        if self._packet_id is not None:
+            return self._packet_id
+        # h*33 ^ byte, masked once at the end: multiply and XOR with a byte
+        # both commute with reduction mod 2^32, so this equals the firmware's
+        # per-step uint32 wraparound.
+        h = 5381 * 33 ^ self._header
+        for b in self._path[:8]:
+            h = h * 33 ^ b
+        for b in self._payload[:16]:
+            h = h * 33 ^ b
         h &= 0xFFFFFFFF
-        for i in range(min(len(self.path), 8)):
-            h = ((h << 5) + h) ^ self.path[i]
-            h &= 0xFFFFFFFF
-        for i in range(min(len(self.payload), 16)):
-            h = ((h << 5) + h) ^ self.payload[i]
-            h &= 0xFFFFFFFF
+        self._packet_id = h
         return h
 
+    def invalidate_packet_id(self):
+        self._packet_id = None
+
     def clear(self):
-        self.header = 0
-        self.path = []
-        self.payload = b''
+        self._header = 0
+        self._path = bytearray()
+        self._payload = b''
         self.rx_time = 0
         self.snr = 0
         self.rssi = 0
+        self._packet_id = None
 
     def copy(self) -> MCPacket:
-        pkt = MCPacket()
-        pkt.header = self.header
-        pkt.path = list(self.path)
-        pkt.payload = self.payload
+        """Shallow clone: payload bytes are shared, only path is duplicated."""
+        pkt = MCPacket.__new__(MCPacket)  # skip __init__, every slot is set below
+        pkt._header = self._header
+        pkt._path = self._path[:]
+        pkt._payload = self._payload
         pkt.rx_time = self.rx_time
         pkt.snr = self.snr
         pkt.rssi = self.rssi
+        pkt._packet_id = self._packet_id
         return pkt
 
     def __repr__(self):
-        rt = route_type_name(self.route_type)
-        pt = payload_type_name(self.payload_type)
-        return f"MCPacket({rt} {pt} path={self.path} payload={len(self.payload)}B)"
+        rt = route_type_name(get_route_type(self._header))
+        pt = payload_type_name(get_payload_type(self._header))
+        return f"MCPacket({rt} {pt} path={list(self._path)} payload={len(self._payload)}B)"
+
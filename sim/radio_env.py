@@ -3,6 +3,8 @@ RadioEnvironment - simulated RF channel with propagation, collisions, delay.
 """
 
 from __future__ import annotations
+import heapq
+import itertools
 import math
 from dataclasses import dataclass, field
 from sim.clock import VirtualClock
@@ -13,21 +15,21 @@ from sim.node import SimNode
 DEFAULT_AIRTIME_MS = 200
 
 
-@dataclass
+@dataclass(slots=True)
 class NodePlacement:
     node: SimNode
     x: float  # meters
     y: float  # meters
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkConfig:
     rssi: int = -70
     snr: int = 32  # SNR * 4 = 8.0 dB
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class InFlightPacket:
     sender_name: str
     packet: MCPacket
@@ -35,6 +37,11 @@ class InFlightPacket:
     targets: list[tuple[str, int, int]]  # [(node_name, rssi, snr)]
 
 
+def _link_key(node_a: str, node_b: str) -> tuple[str, str]:
+    """Order-independent key for _links (names sorted, no temp list)."""
+    return (node_a, node_b) if node_a <= node_b else (node_b, node_a)
+
+
 class RadioEnvironment:
     """Simulated radio environment connecting nodes."""
 
@@ -42,7 +49,12 @@ class RadioEnvironment:
         self.clock = clock
         self._nodes: dict[str, NodePlacement] = {}
         self._links: dict[tuple[str, str], LinkConfig] = {}
-        self._in_flight: list[InFlightPacket] = []
+        # Per-node view of _links (same LinkConfig objects): name -> {peer: link}
+        self._adj: dict[str, dict[str, LinkConfig]] = {}
+        self.links_version: int = 0  # bumped whenever _links changes
+        # Min-heap of (deliver_time, seq, packet); seq keeps TX order on ties
+        self._in_flight: list[tuple[int, int, InFlightPacket]] = []
+        self._tx_seq = itertools.count()
         self.airtime_ms: int = DEFAULT_AIRTIME_MS
         self.events: list[dict] = []  # events generated during tick
 
@@ -55,19 +67,30 @@ class RadioEnvironment:
         to_remove = [k for k in self._links if name in k]
         for k in to_remove:
             del self._links[k]
+        if to_remove:
+            self.links_version += 1
+        for peer in self._adj.pop(name, {}):
+            self._adj.get(peer, {}).pop(name, None)
 
     def set_link(self, node_a: str, node_b: str, rssi: int = -70, snr: int = 32):
         """Set bidirectional link between two nodes."""
-        key = tuple(sorted([node_a, node_b]))
-        self._links[key] = LinkConfig(rssi=rssi, snr=snr, enabled=True)
+        key = _link_key(node_a, node_b)
+        link = LinkConfig(rssi=rssi, snr=snr, enabled=True)
+        self._links[key] = link
+        self.links_version += 1
+        self._adj.setdefault(node_a, {})[node_b] = link
+        self._adj.setdefault(node_b, {})[node_a] = link
 
     def remove_link(self, node_a: str, node_b: str):
-        key = tuple(sorted([node_a, node_b]))
-        self._links.pop(key, None)
+        key = _link_key(node_a, node_b)
+        if self._links.pop(key, None) is not None:
+            self.links_version += 1
+        self._adj.get(node_a, {}).pop(node_b, None)
+        self._adj.get(node_b, {}).pop(node_a, None)
 
     def get_link(self, node_a: str, node_b: str) -> LinkConfig | None:
-        key = tuple(sorted([node_a, node_b]))
-        return self._links.get(key)
+        links = self._adj.get(node_a)
+        return links.get(node_b) if links else None
 
     def get_node_position(self, name: str) -> tuple[float, float] | None:
         np = self._nodes.get(name)
@@ -80,23 +103,26 @@ class RadioEnvironment:
 
     def transmit(self, sender: SimNode, pkt: MCPacket):
         """Sender transmits a packet. Delivered after airtime delay."""
-        targets = []
-        for name, np in self._nodes.items():
-            if name == sender.name:
-                continue
-            link = self.get_link(sender.name, name)
-            if link and link.enabled:
-                targets.append((name, link.rssi, link.snr))
+        # Walk only the sender's links: O(degree) instead of O(nodes)
+        sender_name = sender.name
+        nodes = self._nodes
+        targets = [
+            (name, link.rssi, link.snr)
+            for name, link in self._adj.get(sender_name, {}).items()
+            if link.enabled and name != sender_name and name in nodes
+        ]
 
         if targets:
             deliver_time = self.clock.millis() + self.airtime_ms
+            pkt.get_packet_id()  # memoize once for every receiver
+            # The radio takes ownership (as TxQueue does): no copy on TX
             ifp = InFlightPacket(
                 sender_name=sender.name,
-                packet=pkt.copy(),
+                packet=pkt,
                 deliver_time=deliver_time,
                 targets=targets,
             )
-            self._in_flight.append(ifp)
+            heapq.heappush(self._in_flight, (deliver_time, next(self._tx_seq), ifp))
 
             self.events.append({
                 'type': 'packet_tx',
@@ -109,30 +135,29 @@ class RadioEnvironment:
     def tick(self):
         """Process in-flight packets, deliver those whose airtime has elapsed."""
         now = self.clock.millis()
-        still_in_flight = []
-
-        for ifp in self._in_flight:
-            if now >= ifp.deliver_time:
-                # Check for collisions: two packets arriving at same node simultaneously
-                # Simple model: if two in-flight overlap delivery time, both lost at shared targets
-                # For now, deliver without collision (can enhance later)
-                for target_name, rssi, snr in ifp.targets:
-                    np = self._nodes.get(target_name)
-                    if np:
-                        rx_pkt = ifp.packet.copy()
-                        np.node.on_rx_packet(rx_pkt, rssi, snr)
-                        self.events.append({
-                            'type': 'packet_rx',
-                            'from': ifp.sender_name,
-                            'to': target_name,
-                            'pkt_type': ifp.packet.payload_type,
-                            'rssi': rssi,
-                            'ts': now,
-                        })
-            else:
-                still_in_flight.append(ifp)
-
-        self._in_flight = still_in_flight
+        heap = self._in_flight
+
+        while heap and heap[0][0] <= now:
+            ifp = heapq.heappop(heap)[2]
+            # One packet object serves every target. on_rx_packet overwrites
+            # rssi/snr/rx_time on entry, and receivers copy() before changing
+            # the path, so nothing else is mutated and nothing is retained.
+            rx_pkt = ifp.packet
+            # Check for collisions: two packets arriving at same node simultaneously
+            # Simple model: if two in-flight overlap delivery time, both lost at shared targets
+            # For now, deliver without collision (can enhance later)
+            for target_name, rssi, snr in ifp.targets:
+                np = self._nodes.get(target_name)
+                if np:
+                    np.node.on_rx_packet(rx_pkt, rssi, snr)
+                    self.events.append({
+                        'type': 'packet_rx',
+                        'from': ifp.sender_name,
+                        'to': target_name,
+                        'pkt_type': ifp.packet.payload_type,
+                        'rssi': rssi,
+                        'ts': now,
+                    })
 
     def get_nodes(self) -> dict[str, NodePlacement]:
         return self._nodes
@@ -141,4 +166,4 @@ class RadioEnvironment:
         return self._links
 
     def has_in_flight(self) -> bool:
-        return len(self._in_flight) > 0
+        return bool(self._in_flight)
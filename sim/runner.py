@@ -3,10 +3,15 @@ SimRunner - orchestrator for multi-node mesh simulation.
 """
 
 from __future__ import annotations
+from collections import deque
 from sim.clock import VirtualClock
+from sim.packet import MC_TYPE_REPEATER
 from sim.radio_env import RadioEnvironment
 from sim.node import SimNode, SimRepeater, SimCompanion
 
+EVENT_HISTORY_MAX = 100_000  # events kept in SimRunner.events (oldest dropped)
+_HEX2 = [f"{i:02X}" for i in range(256)]  # byte -> "XX" for get_state
+
 
 class SimRunner:
     """Orchestrates the mesh simulation."""
@@ -15,32 +20,49 @@ class SimRunner:
         self.clock = VirtualClock()
         self.radio = RadioEnvironment(self.clock)
         self.nodes: dict[str, SimNode] = {}
-        self.events: list[dict] = []
+        self._node_items: list[tuple[str, SimNode]] = []  # run_step's view of nodes
+        self.events: deque[dict] = deque(maxlen=EVENT_HISTORY_MAX)
         self.paused: bool = True
         self.speed: float = 1.0  # multiplier
         self.tick_ms: int = 10
+        # get_state's links list, reused until the radio's links change
+        self._links_state: list[dict] = []
+        self._links_state_key: tuple[RadioEnvironment, int] | None = None
+        # Bumped by every SimRunner mutator; get_state reuses its last
+        # snapshot while this, the radio links, clock, paused and speed
+        # are unchanged
+        self._state_version: int = 0
+        self._state_cache: tuple[tuple, dict] | None = None
 
     def add_repeater(self, name: str, x: float = 0.0, y: float = 0.0) -> SimRepeater:
         node = SimRepeater(name, self.clock)
         self.nodes[name] = node
+        self._node_items = list(self.nodes.items())
+        self._state_version += 1
         self.radio.add_node(node, x, y)
         return node
 
     def add_companion(self, name: str, x: float = 0.0, y: float = 0.0) -> SimCompanion:
         node = SimCompanion(name, self.clock)
         self.nodes[name] = node
+        self._node_items = list(self.nodes.items())
+        self._state_version += 1
         self.radio.add_node(node, x, y)
         return node
 
     def remove_node(self, name: str):
         self.nodes.pop(name, None)
+        self._node_items = list(self.nodes.items())
+        self._state_version += 1
         self.radio.remove_node(name)
 
     def set_link(self, node_a: str, node_b: str, rssi: int = -70, snr: int = 32):
         self.radio.set_link(node_a, node_b, rssi, snr)
+        self._state_version += 1
 
     def remove_link(self, node_a: str, node_b: str):
         self.radio.remove_link(node_a, node_b)
+        self._state_version += 1
 
     def inject_command(self, node_name: str, cmd: str) -> str:
         """Send CLI command to a node."""
@@ -48,54 +70,77 @@ class SimRunner:
         if not node:
             return f"Node '{node_name}' not found"
         if isinstance(node, (SimRepeater, SimCompanion)):
+            self._state_version += 1  # commands may change node config
             return node.process_command(cmd)
         return "Node has no CLI"
 
     def run_step(self, tick_ms: int | None = None) -> list[dict]:
         """Run a single simulation step. Returns events."""
         dt = tick_ms or self.tick_ms
-        self.radio.events.clear()
+        radio = self.radio
         step_events = []
+        self._state_version += 1
 
         # Advance clock
         self.clock.advance(dt)
 
         # Tick all nodes - collect packets to transmit
-        for name, node in self.nodes.items():
+        for name, node in self._node_items:
             packets = node.tick()
             for pkt in packets:
-                self.radio.transmit(node, pkt)
+                radio.transmit(node, pkt)
 
             # Collect log events
-            while node.log_buffer:
-                ts, msg = node.log_buffer.pop(0)
-                event = {'type': 'log', 'node': name, 'msg': msg, 'ts': ts}
-                step_events.append(event)
+            log_buffer = node.log_buffer
+            if log_buffer:
+                for ts, msg in log_buffer:
+                    step_events.append({'type': 'log', 'node': name, 'msg': msg, 'ts': ts})
+                log_buffer.clear()
 
         # Process radio (deliver packets whose airtime elapsed)
-        self.radio.tick()
+        if radio.has_in_flight():
+            radio.tick()
 
-        # Collect radio events
-        step_events.extend(self.radio.events)
+        # Collect radio events, swapping in a fresh buffer for the next step
+        step_events.extend(radio.events)
+        radio.events = []
 
         self.events.extend(step_events)
         return step_events
 
     def run(self, duration_ms: int, tick_ms: int = 10):
         """Run simulation for given duration."""
-        end_time = self.clock.millis() + duration_ms
-        while self.clock.millis() < end_time:
-            self.run_step(tick_ms)
+        millis = self.clock.millis
+        step = self.run_step
+        end_time = millis() + duration_ms
+        while millis() < end_time:
+            step(tick_ms)
 
     def get_state(self) -> dict:
-        """Get full simulation state snapshot for GUI."""
+        """Get full simulation state snapshot for GUI.
+
+        While nothing has changed (no step, command, node change or radio
+        link change, same clock, paused and speed), the previous snapshot
+        is reused. Each call returns a fresh top-level dict, but the
+        'nodes' and 'links' values are shared between calls and must be
+        treated as read-only. Node changes made by calling node methods
+        directly show up after the next run_step.
+        """
+        radio = self.radio
+        key = (self._state_version, radio.links_version, self.clock.millis(),
+               self.paused, self.speed)
+        cache = self._state_cache
+        if cache is not None and cache[0] == key:
+            return dict(cache[1])
+
         nodes_state = {}
         for name, node in self.nodes.items():
             pos = self.radio.get_node_position(name)
+            is_repeater = node.node_type == MC_TYPE_REPEATER  # fixed at construction
             nodes_state[name] = {
                 'name': name,
-                'hash': f"{node.identity.hash:02X}",
-                'type': 'repeater' if isinstance(node, SimRepeater) else 'companion',
+                'hash': _HEX2[node.identity.hash],
+                'type': 'repeater' if is_repeater else 'companion',
                 'x': pos[0] if pos else 0,
                 'y': pos[1] if pos else 0,
                 'stats': {
@@ -108,34 +153,45 @@ class SimRunner:
                 },
                 'time_synced': node.time_sync.is_synchronized(),
                 'seen_nodes': [
-                    {'hash': f"{n.hash:02X}", 'name': n.name, 'rssi': n.last_rssi,
+                    {'hash': _HEX2[n.hash], 'name': n.name, 'rssi': n.last_rssi,
                      'pkt_count': n.pkt_count}
                     for n in node.seen_nodes.nodes
                 ],
-                'flags': f"0x{node.identity.flags:02X}",
+                'flags': "0x" + _HEX2[node.identity.flags],
             }
-            if isinstance(node, SimRepeater):
-                nodes_state[name]['neighbours'] = node.neighbours
-
-        links_state = []
-        for (a, b), lc in self.radio.get_links().items():
-            links_state.append({
-                'node_a': a, 'node_b': b,
-                'rssi': lc.rssi, 'snr': lc.snr, 'enabled': lc.enabled,
-            })
-
-        return {
+            if is_repeater:
+                nodes_state[name]['neighbours'] = [
+                    {'hash': n.hash, 'rssi': n.rssi, 'snr': n.snr,
+                     'last_seen': n.last_seen, 'cb_state': n.cb_state}
+                    for n in node.neighbours.values()
+                ]
+
+        links_key = (radio, radio.links_version)
+        if self._links_state_key != links_key:
+            self._links_state = [
+                {'node_a': a, 'node_b': b,
+                 'rssi': lc.rssi, 'snr': lc.snr, 'enabled': lc.enabled}
+                for (a, b), lc in radio.get_links().items()
+            ]
+            self._links_state_key = links_key
+        links_state = self._links_state
+
+        state = {
             'time_ms': self.clock.millis(),
             'nodes': nodes_state,
             'links': links_state,
             'paused': self.paused,
             'speed': self.speed,
         }
+        self._state_cache = (key, state)
+        return dict(state)
 
     def reset(self):
         """Reset simulation."""
         self.clock.reset()
         self.nodes.clear()
+        self._node_items = []
+        self._state_version += 1
         self.radio = RadioEnvironment(self.clock)
         self.events.clear()
         self.paused = True
@@ -145,7 +201,7 @@ class SimRunner:
         print(f"\n=== Topology ({len(self.nodes)} nodes) ===")
         for name, node in self.nodes.items():
             pos = self.radio.get_node_position(name)
-            ntype = "R" if isinstance(node, SimRepeater) else "C"
+            ntype = "R" if node.node_type == MC_TYPE_REPEATER else "C"
             print(f"  [{ntype}] {name} ({node.identity.hash:02X}) "
                   f"pos=({pos[0]:.0f},{pos[1]:.0f})")
         print("Links:")
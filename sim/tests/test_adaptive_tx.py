@@ -62,6 +62,13 @@ class TestAdaptiveTxPowerAdjustment:
         result = r.evaluate_adaptive_tx_power()
         assert result == 10 + ADAPTIVE_TX_STEP
 
+    def test_running_snr_sum_tracks_updates(self):
+        r, _ = make_repeater()
+        r._update_neighbour(0xAA, -50, 60)
+        r._update_neighbour(0xBB, -110, -30)
+        r._update_neighbour(0xAA, -80, 12)  # update replaces, not adds
+        assert r._snr_sum == sum(n.snr for n in r.neighbours.values()) == -18
+
     def test_no_change_in_middle_range(self):
         """SNR in middle range → no change."""
         r, _ = make_repeater()
@@ -123,3 +130,15 @@ class TestAdaptiveTxPowerAdjustment:
         # Should see TxP log
         tx_logs = [msg for _, msg in r.log_history if "TxP:" in msg]
         assert len(tx_logs) > 0
+
+    def test_tick_skips_evaluation_once_disabled(self):
+        r, clock = make_repeater()
+        r.adaptive_tx_enabled = True
+        r.adaptive_tx_enabled = False
+        r._update_neighbour(0xAA, -40, 60)
+
+        clock.advance(60001)
+        r.tick()
+
+        assert r.current_tx_power == DEFAULT_TX_POWER
+        assert not [msg for _, msg in r.log_history if "TxP:" in msg]
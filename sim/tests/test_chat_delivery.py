@@ -40,7 +40,7 @@ class TestChatDeliveryTiming:
         """Costruisce un pacchetto PLAIN simile a un messaggio chat."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [src.identity.hash]
+        pkt.path = bytearray([src.identity.hash])
         # Formato: [dest_hash][src_hash][marker][text]
         pkt.payload = bytes([dest_hash, src.identity.hash, ord('D'), ord('P')]) + text.encode()
         # Registra nel packet cache del sender per evitare auto-echo
@@ -115,8 +115,9 @@ class TestChatDeliveryTiming:
         max_steps = 500  # 5 secondi
         delivery_time = None
         for _ in range(max_steps):
-            self.runner.run_step(10)
-            bob_rx = [ts for ts, msg in self.bob.log_history if "from" in msg]
+            # Scan only this step's log events, not Bob's whole history
+            bob_rx = [ev['ts'] for ev in self.runner.run_step(10)
+                      if ev['type'] == 'log' and ev['node'] == "Bob" and "from" in ev['msg']]
             if bob_rx:
                 delivery_time = bob_rx[0]
                 break
@@ -149,7 +150,7 @@ class TestChatNoDirectLink:
 
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.alice.identity.hash]
+        pkt.path = bytearray([self.alice.identity.hash])
         pkt.payload = bytes([self.bob.identity.hash, self.alice.identity.hash,
                              ord('D'), ord('P')]) + b"nope"
         self.alice.packet_cache.add_if_new(pkt.get_packet_id())
@@ -166,7 +167,7 @@ class TestChatNoDirectLink:
 
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [self.alice.identity.hash]
+        pkt.path = bytearray([self.alice.identity.hash])
         pkt.payload = bytes([self.bob.identity.hash, self.alice.identity.hash,
                              ord('D'), ord('P')]) + b"nope"
         self.alice.packet_cache.add_if_new(pkt.get_packet_id())
@@ -21,32 +21,32 @@ class TestCBStateTransitions:
     def test_good_snr_stays_closed(self):
         r, _ = make_repeater()
         r._update_neighbour(0xAA, -60, 20)  # SNR*4=20 > threshold
-        assert r.neighbours[0]['cb_state'] == CB_STATE_CLOSED
+        assert r.neighbours[0xAA].cb_state == CB_STATE_CLOSED
 
     def test_bad_snr_opens_breaker(self):
         r, _ = make_repeater()
         r._update_neighbour(0xAA, -110, -50)  # SNR*4=-50 < -40
-        assert r.neighbours[0]['cb_state'] == CB_STATE_CLOSED  # first add is always closed
+        assert r.neighbours[0xAA].cb_state == CB_STATE_CLOSED  # first add is always closed
         # Second update with bad SNR
         r._update_neighbour(0xAA, -110, -50)
-        assert r.neighbours[0]['cb_state'] == CB_STATE_OPEN
+        assert r.neighbours[0xAA].cb_state == CB_STATE_OPEN
 
     def test_good_snr_closes_open_breaker(self):
         r, _ = make_repeater()
         r._update_neighbour(0xAA, -110, -50)
         r._update_neighbour(0xAA, -110, -50)  # now OPEN
-        assert r.neighbours[0]['cb_state'] == CB_STATE_OPEN
+        assert r.neighbours[0xAA].cb_state == CB_STATE_OPEN
         r._update_neighbour(0xAA, -60, 20)  # good SNR → close
-        assert r.neighbours[0]['cb_state'] == CB_STATE_CLOSED
+        assert r.neighbours[0xAA].cb_state == CB_STATE_CLOSED
 
     def test_timeout_to_half_open(self):
         r, clock = make_repeater()
         r._update_neighbour(0xAA, -110, -50)
         r._update_neighbour(0xAA, -110, -50)  # OPEN
-        assert r.neighbours[0]['cb_state'] == CB_STATE_OPEN
+        assert r.neighbours[0xAA].cb_state == CB_STATE_OPEN
         clock.advance(CB_TIMEOUT_MS + 1)
         r._tick_circuit_breakers()
-        assert r.neighbours[0]['cb_state'] == CB_STATE_HALF_OPEN
+        assert r.neighbours[0xAA].cb_state == CB_STATE_HALF_OPEN
 
 
 class TestCBForwarding:
@@ -61,7 +61,7 @@ class TestCBForwarding:
         # Build a DIRECT packet: path = [our_hash, target_hash]
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_DIRECT, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)  # DIRECT
-        pkt.path = [r.identity.hash, target_hash]
+        pkt.path = bytearray([r.identity.hash, target_hash])
         pkt.payload = bytes([0xFF, 0xCC, ord('D'), ord('P')]) + b"test"
         # Ensure unique packet ID
         pkt_id = pkt.get_packet_id()
@@ -80,7 +80,7 @@ class TestCBForwarding:
 
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_DIRECT, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)  # DIRECT
-        pkt.path = [r.identity.hash, target_hash]
+        pkt.path = bytearray([r.identity.hash, target_hash])
         pkt.payload = bytes([0xFF, 0xCC, ord('D'), ord('P')]) + b"test"
 
         r.on_rx_packet(pkt, -60, 20)
@@ -98,7 +98,7 @@ class TestCBForwarding:
 
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [0xCC]
+        pkt.path = bytearray([0xCC])
         pkt.payload = bytes([0xFF, 0xDD, ord('D'), ord('P')]) + b"test"
 
         r.on_rx_packet(pkt, -60, 20)
@@ -84,6 +84,22 @@ class TestHMAC:
         data = b"test"
         assert compute_hmac(key, data) == compute_hmac(key, data)
 
+    def test_hmac_matches_sha256_reference(self):
+        import hmac, hashlib
+        key = bytes(range(32))
+        data = b"test"
+        ref = hmac.new(key, data, hashlib.sha256).digest()[:MC_CIPHER_MAC_SIZE]
+        assert compute_hmac(key, data) == ref
+
+    def test_blake2_mac_opt_in(self, monkeypatch):
+        import hashlib
+        import sim.crypto as crypto
+        key = bytes(range(32))
+        monkeypatch.setattr(crypto, "USE_BLAKE2_MAC", True)
+        mac = compute_hmac(key, b"test")
+        assert mac == hashlib.blake2b(b"test", key=key, digest_size=MC_CIPHER_MAC_SIZE).digest()
+        assert verify_hmac(mac, key, b"test")
+
 
 class TestEncryptThenMAC:
     def test_roundtrip(self):
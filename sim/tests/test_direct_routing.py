@@ -5,6 +5,7 @@ by peeling the path (removing path[0]) instead of appending.
 """
 
 import pytest
+import random
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -30,7 +31,7 @@ def make_flood_pkt(dest_hash=0xAA, src_hash=0xBB, path=None):
     pkt = MCPacket()
     pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_REQUEST, MC_PAYLOAD_VER_1)
     pkt.payload = bytes([dest_hash, src_hash]) + b'\x00' * 20
-    pkt.path = list(path) if path else [src_hash]
+    pkt.path = bytearray(path) if path else bytearray([src_hash])
     return pkt
 
 
@@ -39,7 +40,7 @@ def make_direct_pkt(path, dest_hash=0xAA, src_hash=0xBB):
     pkt = MCPacket()
     pkt.set_header(MC_ROUTE_DIRECT, MC_PAYLOAD_REQUEST, MC_PAYLOAD_VER_1)
     pkt.payload = bytes([dest_hash, src_hash]) + b'\x00' * 20
-    pkt.path = list(path)
+    pkt.path = bytearray(path)
     return pkt
 
 
@@ -94,6 +95,24 @@ class TestDirectRoutingShouldForward:
         pkt = make_flood_pkt(dest_hash=0x33, src_hash=0x44, path=[0x44, my_hash])
         assert rpt._should_forward(pkt) is False
 
+    def test_flood_loop_beyond_id_prefix_not_cached(self):
+        """Loop reject at path index >= 8 leaves the id out of the cache.
+
+        The packet id only covers path[:8], so a later flood sharing that
+        prefix but without our hash is forwarded rather than deduped.
+        """
+        rpt = make_repeater("RPTF3")
+        my_hash = rpt.identity.hash
+        prefix = [h for h in range(0x10, 0x20) if h != my_hash][:8]
+        dest = my_hash ^ 0x80  # never addressed to us
+        looped = make_flood_pkt(dest_hash=dest, src_hash=prefix[0],
+                                path=prefix + [my_hash])
+        other = make_flood_pkt(dest_hash=dest, src_hash=prefix[0],
+                               path=prefix + [my_hash ^ 0xFF])
+        assert looped.get_packet_id() == other.get_packet_id()
+        assert rpt._should_forward(looped) is False
+        assert rpt._should_forward(other) is True
+
 
 class TestDirectRoutingPathHandling:
     """Test the path modification in on_rx_packet."""
@@ -108,7 +127,7 @@ class TestDirectRoutingPathHandling:
         assert rpt.tx_queue.count > 0
         fwd = rpt.tx_queue.pop()
         # Path should have our hash removed, leaving [0xCC, 0xDD]
-        assert fwd.path == [0xCC, 0xDD]
+        assert fwd.path == bytearray([0xCC, 0xDD])
         assert fwd.route_type == MC_ROUTE_DIRECT
 
     def test_direct_pkt_single_hop_peels_to_empty(self):
@@ -119,7 +138,7 @@ class TestDirectRoutingPathHandling:
         rpt.on_rx_packet(pkt, rssi=-80, snr=20)
         assert rpt.tx_queue.count > 0
         fwd = rpt.tx_queue.pop()
-        assert fwd.path == []
+        assert fwd.path == bytearray()
 
     def test_flood_pkt_appends_hash(self):
         """FLOOD forwarding should append our hash to path."""
@@ -129,7 +148,7 @@ class TestDirectRoutingPathHandling:
         rpt.on_rx_packet(pkt, rssi=-80, snr=20)
         assert rpt.tx_queue.count > 0
         fwd = rpt.tx_queue.pop()
-        assert fwd.path == [0xBB, my_hash]
+        assert fwd.path == bytearray([0xBB, my_hash])
 
     def test_direct_not_forwarded_wrong_hop(self):
         """DIRECT packet not addressed to us as next hop should not be forwarded."""
@@ -173,13 +192,26 @@ class TestDirectRoutingMultiHop:
         rpt1.on_rx_packet(pkt, rssi=-80, snr=20)
         assert rpt1.tx_queue.count > 0
         fwd1 = rpt1.tx_queue.pop()
-        assert fwd1.path == [h2, 0xDD]
+        assert fwd1.path == bytearray([h2, 0xDD])
 
         # RPT2 receives the forwarded packet and forwards
         rpt2.on_rx_packet(fwd1, rssi=-80, snr=20)
         assert rpt2.tx_queue.count > 0
         fwd2 = rpt2.tx_queue.pop()
-        assert fwd2.path == [0xDD]
+        assert fwd2.path == bytearray([0xDD])
+
+    def test_direct_chain_peels_one_hop_each(self):
+        """Each repeater along a DIRECT chain peels exactly its own hash."""
+        for n in (1, 2, 3, 5):
+            chain = [make_repeater(f"RPT{i}") for i in range(n)]
+            hashes = [r.identity.hash for r in chain]
+            dest = next(h for h in range(256) if h not in hashes)  # not addressed to a hop
+            pkt = make_direct_pkt(path=hashes + [0xDD], dest_hash=dest)
+            for i, rpt in enumerate(chain):
+                rpt.on_rx_packet(pkt, rssi=-80, snr=20)
+                pkt = rpt.tx_queue.pop()
+                assert pkt is not None, f"hop {i} of {n} did not forward"
+                assert pkt.path == bytearray(hashes[i + 1:] + [0xDD])
 
     def test_direct_response_uses_reverse_path(self):
         """Simulate FLOOD discovery -> DIRECT response pattern."""
@@ -190,7 +222,7 @@ class TestDirectRoutingMultiHop:
         flood_pkt = make_flood_pkt(dest_hash=0xAA, src_hash=0xBB, path=[0xBB])
         rpt.on_rx_packet(flood_pkt, rssi=-80, snr=20)
         fwd = rpt.tx_queue.pop()
-        assert fwd.path == [0xBB, my_hash]  # path built up
+        assert fwd.path == bytearray([0xBB, my_hash])  # path built up
 
         # Step 2: Response from companion B via DIRECT with reverse path
         # B saw path [0xBB, my_hash], so it sends back via [my_hash, 0xBB]
@@ -201,7 +233,7 @@ class TestDirectRoutingMultiHop:
         rpt.on_rx_packet(direct_pkt, rssi=-80, snr=20)
         assert rpt.tx_queue.count > 0
         fwd2 = rpt.tx_queue.pop()
-        assert fwd2.path == [0xBB]  # peeled, next hop is 0xBB
+        assert fwd2.path == bytearray([0xBB])  # peeled, next hop is 0xBB
 
 
 class TestAdvertForwarding:
@@ -231,11 +263,11 @@ class TestAdvertForwarding:
         """Forwarded ADVERT should have repeater hash added to path."""
         rpt = make_repeater("RPT_ADV2")
         adv, _ = self._make_advert_from("Companion2")
-        adv.path = [0xBB]  # already passed through another node
+        adv.path = bytearray([0xBB])  # already passed through another node
         rpt.on_rx_packet(adv, rssi=-80, snr=20)
         assert rpt.tx_queue.count > 0
         fwd = rpt.tx_queue.pop()
-        assert fwd.path == [0xBB, rpt.identity.hash]
+        assert fwd.path == bytearray([0xBB, rpt.identity.hash])
 
     def test_advert_not_forwarded_if_duplicate(self):
         """Same ADVERT received twice should be forwarded only once."""
@@ -264,7 +296,7 @@ class TestAdvertForwarding:
         rpt = make_repeater("RPT_ADV5")
         adv, _ = self._make_advert_from("Companion5")
         adv.set_header(MC_ROUTE_DIRECT, MC_PAYLOAD_ADVERT, 0)
-        adv.path = [0xFF]  # not our hash
+        adv.path = bytearray([0xFF])  # not our hash
         rpt.on_rx_packet(adv, rssi=-80, snr=20)
         assert rpt.tx_queue.count == 0
 
@@ -278,19 +310,19 @@ class TestAdvertForwarding:
         rpt1.on_rx_packet(adv, rssi=-90, snr=10)
         assert rpt1.tx_queue.count > 0
         fwd1 = rpt1.tx_queue.pop()
-        assert fwd1.path == [rpt1.identity.hash]
+        assert fwd1.path == bytearray([rpt1.identity.hash])
 
         # RPT2 receives the forwarded ADVERT
         rpt2.on_rx_packet(fwd1, rssi=-85, snr=15)
         assert rpt2.tx_queue.count > 0
         fwd2 = rpt2.tx_queue.pop()
-        assert fwd2.path == [rpt1.identity.hash, rpt2.identity.hash]
+        assert fwd2.path == bytearray([rpt1.identity.hash, rpt2.identity.hash])
 
     def test_advert_loop_prevention(self):
         """ADVERT with our hash already in path should NOT be forwarded."""
         rpt = make_repeater("RPT_ADV6")
         adv, _ = self._make_advert_from("LoopNode")
-        adv.path = [0xBB, rpt.identity.hash]  # we're already in path
+        adv.path = bytearray([0xBB, rpt.identity.hash])  # we're already in path
         rpt.on_rx_packet(adv, rssi=-80, snr=20)
         assert rpt.tx_queue.count == 0
 
@@ -466,3 +498,21 @@ class TestDirectVsFloodDelay:
         rpt.on_rx_packet(pkt, rssi=-80, snr=20)
         logs = [msg for _, msg in rpt.log_history if "d=" in msg and "Direct" in msg]
         assert len(logs) > 0
+
+    def test_jitter_draws_do_not_depend_on_verbose(self):
+        """Same seed leaves the same RNG state with logging on or off."""
+        states = []
+        for verbose in (True, False):
+            rpt = make_repeater("RPT_DLY3")
+            rpt.verbose = verbose
+            my_hash = rpt.identity.hash
+            flood = make_flood_pkt(dest_hash=my_hash ^ 0x80, src_hash=my_hash ^ 0x01,
+                                   path=[my_hash ^ 0x01])
+            direct = make_direct_pkt(path=[my_hash, my_hash ^ 0x02],
+                                     dest_hash=my_hash ^ 0x80)
+            random.seed(1234)
+            rpt.on_rx_packet(flood, rssi=-80, snr=20)
+            rpt.on_rx_packet(direct, rssi=-80, snr=20)
+            assert rpt.stats.fwd_count == 2
+            states.append(random.getstate())
+        assert states[0] == states[1]
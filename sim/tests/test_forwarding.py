@@ -52,6 +52,31 @@ class TestLinearForwarding:
         fwd_logs = [msg for _, msg in self.b.log_history if "[F]" in msg]
         assert len(fwd_logs) > 0
 
+    def test_quiet_node_still_forwards(self):
+        """verbose=False drops logging only, not forwarding."""
+        self.b.verbose = False
+        self.a.send_directed_ping(self.c.identity.hash)
+        self.runner.run(5000, tick_ms=10)
+        assert self.b.stats.fwd_count > 0
+        assert len(self.b.log_history) == 0
+
+
+class TestSharedReception:
+    def test_each_receiver_sees_its_own_link(self):
+        """One in-flight packet is shared by all targets; link metadata is not."""
+        runner = SimRunner()
+        a = runner.add_repeater("A")
+        b = runner.add_companion("B")
+        c = runner.add_companion("C")
+        runner.set_link("A", "B", rssi=-60, snr=32)
+        runner.set_link("A", "C", rssi=-95, snr=8)
+
+        a.send_advert(True)
+        runner.run(1000, tick_ms=10)
+
+        assert b.seen_nodes.get_by_hash(a.identity.hash).last_rssi == -60
+        assert c.seen_nodes.get_by_hash(a.identity.hash).last_rssi == -95
+
 
 class TestDeduplication:
     """Test that duplicate packets are not processed twice."""
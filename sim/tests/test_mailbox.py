@@ -84,6 +84,14 @@ class TestMailboxUnit:
         assert self.mbox.store(0xAA, b"\x01\x02\x04", 1001)  # different payload
         assert self.mbox.get_count() == 2
 
+    def test_dedup_released_after_pop_and_expiry(self):
+        data = b"\x01\x02\x03"
+        assert self.mbox.store(0xAA, data, 1000)
+        assert self.mbox.pop_for(0xAA) == data
+        assert self.mbox.store(0xAA, data, 1001)  # slot freed, digest dropped
+        self.mbox.expire_old(1001 + MAILBOX_TTL_SEC + 1)
+        assert self.mbox.store(0xAA, data, 1002)
+
     def test_dedup_same_dest_different_content(self):
         assert self.mbox.store(0xAA, b"\x01\x02", 1000)
         assert self.mbox.store(0xAA, b"\x03\x04", 1001)
@@ -156,7 +164,7 @@ class TestMailboxIntegration:
         """Create a PLAIN packet with dest/src hash."""
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [src_hash]
+        pkt.path = bytearray([src_hash])
         pkt.payload = bytes([dest_hash, src_hash]) + marker + text.encode()
         return pkt
 
@@ -334,7 +342,7 @@ class TestMailboxIntegration:
 
         assert found or len(mbox_logs) > 0, \
             f"No forwarded packets. Queue had {len(pkts_to_check)} pkts. " \
-            f"Mbox logs: {mbox_logs}. All logs: {[m for _, m in rpt.log_history[-10:]]}"
+            f"Mbox logs: {mbox_logs}. All logs: {[m for _, m in list(rpt.log_history)[-10:]]}"
 
     def test_no_store_broadcast(self):
         """Packets with dest_hash=0 (broadcast) should not be stored."""
@@ -39,7 +39,7 @@ class TestSerializeDeserialize:
     def test_basic_roundtrip(self):
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [0x5B]
+        pkt.path = bytearray([0x5B])
         pkt.payload = bytes([0xA3, 0x5B, ord('D'), ord('P')]) + b"#1 TestNode"
 
         wire = pkt.serialize()
@@ -59,32 +59,32 @@ class TestSerializeDeserialize:
         restored = MCPacket.deserialize(wire)
 
         assert restored is not None
-        assert restored.path == []
+        assert restored.path == bytearray()
         assert restored.payload == pkt.payload
 
     def test_multi_hop_path(self):
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
-        pkt.path = [0xA3, 0x5B, 0xFF]
+        pkt.path = bytearray([0xA3, 0x5B, 0xFF])
         pkt.payload = b"test"
 
         wire = pkt.serialize()
         restored = MCPacket.deserialize(wire)
 
-        assert restored.path == [0xA3, 0x5B, 0xFF]
+        assert restored.path == bytearray([0xA3, 0x5B, 0xFF])
         assert restored.payload == b"test"
 
     def test_empty_payload(self):
         pkt = MCPacket()
         pkt.header = 0x09
-        pkt.path = [0x01]
+        pkt.path = bytearray([0x01])
         pkt.payload = b''
 
         wire = pkt.serialize()
         restored = MCPacket.deserialize(wire)
 
         assert restored.payload == b''
-        assert restored.path == [0x01]
+        assert restored.path == bytearray([0x01])
 
     def test_wire_format_matches_firmware(self):
         """Wire format: [header][pathLen][path...][payload...]
@@ -99,7 +99,7 @@ class TestSerializeDeserialize:
         # Build wire via MCPacket
         pkt = MCPacket()
         pkt.header = header
-        pkt.path = list(path)
+        pkt.path = bytearray(path)
         pkt.payload = payload
         actual_wire = pkt.serialize()
 
@@ -118,7 +118,7 @@ class TestPacketId:
     def test_djb2_deterministic(self):
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
-        pkt.path = [0xA3]
+        pkt.path = bytearray([0xA3])
         pkt.payload = b"hello"
 
         id1 = pkt.get_packet_id()
@@ -128,12 +128,12 @@ class TestPacketId:
     def test_different_payload_different_id(self):
         pkt1 = MCPacket()
         pkt1.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
-        pkt1.path = [0xA3]
+        pkt1.path = bytearray([0xA3])
         pkt1.payload = b"hello"
 
         pkt2 = MCPacket()
         pkt2.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
-        pkt2.path = [0xA3]
+        pkt2.path = bytearray([0xA3])
         pkt2.payload = b"world"
 
         assert pkt1.get_packet_id() != pkt2.get_packet_id()
@@ -142,12 +142,12 @@ class TestPacketId:
         """Firmware hashes at most 8 path bytes and 16 payload bytes."""
         pkt1 = MCPacket()
         pkt1.header = 0x09
-        pkt1.path = list(range(20))
+        pkt1.path = bytearray(range(20))
         pkt1.payload = bytes(range(32))
 
         pkt2 = MCPacket()
         pkt2.header = 0x09
-        pkt2.path = list(range(8)) + [99] * 12  # first 8 same
+        pkt2.path = bytearray(list(range(8)) + [99] * 12)  # first 8 same
         pkt2.payload = bytes(range(16)) + bytes([99] * 16)  # first 16 same
 
         assert pkt1.get_packet_id() == pkt2.get_packet_id()
@@ -155,11 +155,46 @@ class TestPacketId:
     def test_id_is_32bit(self):
         pkt = MCPacket()
         pkt.header = 0xFF
-        pkt.path = [0xFF] * 8
+        pkt.path = bytearray([0xFF] * 8)
         pkt.payload = bytes([0xFF] * 16)
         pid = pkt.get_packet_id()
         assert 0 <= pid <= 0xFFFFFFFF
 
+    def test_id_memoized_until_invalidated(self):
+        pkt = MCPacket()
+        pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
+        pkt.path = bytearray([0xA3])
+        pkt.payload = b"hello"
+        pid = pkt.get_packet_id()
+
+        fwd = pkt.copy()
+        assert fwd.get_packet_id() == pid
+        fwd.path.append(0x5B)
+        fwd.invalidate_packet_id()
+        assert fwd.get_packet_id() != pid
+        assert pkt.get_packet_id() == pid
+
+        pkt.set_header(MC_ROUTE_DIRECT, MC_PAYLOAD_PLAIN, 0)
+        assert pkt.get_packet_id() != pid
+
+    def test_id_reset_on_field_assignment(self):
+        pkt = MCPacket()
+        pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
+        pkt.path = bytearray([0xA3])
+        pkt.payload = b"hello"
+        pid = pkt.get_packet_id()
+
+        pkt.payload = b"world"
+        assert pkt.get_packet_id() != pid
+        pkt.payload = b"hello"
+        assert pkt.get_packet_id() == pid
+
+        pkt.path = bytearray([0x5B])
+        assert pkt.get_packet_id() != pid
+        pkt.path = bytearray([0xA3])
+        pkt.header = make_header(MC_ROUTE_DIRECT, MC_PAYLOAD_PLAIN, 0)
+        assert pkt.get_packet_id() != pid
+
 
 class TestDirectedPingFormat:
     """Test compatibility with test_directed_ping.py format."""
@@ -222,7 +257,7 @@ class TestPacketProperties:
     def test_copy(self):
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, 0)
-        pkt.path = [0xA3, 0x5B]
+        pkt.path = bytearray([0xA3, 0x5B])
         pkt.payload = b"test"
         pkt.rssi = -70
 
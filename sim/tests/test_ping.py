@@ -93,7 +93,7 @@ class TestBroadcastPing:
         """Broadcast ping format: "PING #N from XXXXXXXX" """
         pkt = MCPacket()
         pkt.set_header(MC_ROUTE_FLOOD, MC_PAYLOAD_PLAIN, MC_PAYLOAD_VER_1)
-        pkt.path = [0x5B]
+        pkt.path = bytearray([0x5B])
 
         node_id = 0x12345678
         ping_counter = 1
@@ -180,3 +180,49 @@ class TestScenario7Companion:
         # C1 should get PONG from C2
         c1_pong = [msg for _, msg in self.c1.log_history if "PONG" in msg and "->" not in msg]
         assert len(c1_pong) > 0, "Comp1 should receive PONG from Comp2"
+
+
+class TestStateSnapshot:
+    def test_links_state_follows_link_changes(self):
+        runner = SimRunner()
+        runner.add_repeater("A")
+        runner.add_repeater("B")
+        runner.add_repeater("C")
+        runner.set_link("A", "B", rssi=-70, snr=32)
+
+        first = runner.get_state()['links']
+        assert runner.get_state()['links'] is first  # unchanged -> reused
+        runner.set_link("B", "C", rssi=-75, snr=28)
+        assert len(runner.get_state()['links']) == 2
+        runner.remove_node("C")
+        assert [(l['node_a'], l['node_b']) for l in runner.get_state()['links']] == [("A", "B")]
+        runner.reset()
+        assert runner.get_state()['links'] == []
+
+    def test_unchanged_state_is_reused(self):
+        runner = SimRunner()
+        a = runner.add_repeater("A")
+        first = runner.get_state()
+        again = runner.get_state()
+        assert again is not first  # callers get their own top-level dict
+        assert again['nodes'] is first['nodes']  # paused, nothing changed
+
+        runner.speed = 2.0
+        second = runner.get_state()
+        assert second['nodes'] is not first['nodes'] and second['speed'] == 2.0
+
+        a.send_advert(True)  # direct node call: seen after the next step
+        runner.run_step(10)
+        third = runner.get_state()
+        assert third is not second
+        assert third['nodes']['A']['stats']['tx'] == 1
+
+    def test_direct_radio_link_change_invalidates_state(self):
+        runner = SimRunner()
+        runner.add_repeater("A")
+        runner.add_repeater("B")
+        assert runner.get_state()['links'] == []
+        runner.radio.set_link("A", "B", rssi=-70, snr=32)  # bypasses SimRunner
+        assert [(l['node_a'], l['node_b']) for l in runner.get_state()['links']] == [("A", "B")]
+        runner.radio.remove_link("A", "B")
+        assert runner.get_state()['links'] == []
@@ -0,0 +1,47 @@
+"""Tests for SeenNodesTracker - update, lookup, oldest eviction."""
+
+import pytest
+from sim.config import SeenNodesTracker, MC_MAX_SEEN_NODES
+
+
+class TestSeenNodesTracker:
+    def test_new_then_update(self):
+        t = SeenNodesTracker()
+        assert t.update(0xAA, -80, 20, name="A", now_ms=100)
+        assert not t.update(0xAA, -70, 24, now_ms=200)
+        n = t.get_by_hash(0xAA)
+        assert n.pkt_count == 2
+        assert n.last_rssi == -70
+        assert n.last_seen == 200
+        assert n.name == "A"  # empty name keeps previous
+
+    def test_unknown_hash(self):
+        t = SeenNodesTracker()
+        t.update(0xAA, -80, 20, now_ms=0)
+        assert t.get_by_hash(0xBB) is None
+
+    def test_evicts_oldest_when_full(self):
+        t = SeenNodesTracker()
+        for i in range(MC_MAX_SEEN_NODES):
+            t.update(i + 1, -80, 20, now_ms=1000 + i)
+        t.update(1, -80, 20, now_ms=5000)  # refresh first, node 2 is now oldest
+        assert t.update(0xEE, -80, 20, now_ms=6000)
+        assert len(t.nodes) == MC_MAX_SEEN_NODES
+        assert t.get_by_hash(2) is None
+        assert t.get_by_hash(1) is not None
+        assert t.get_by_hash(0xEE).last_seen == 6000
+
+    def test_update_many_counts_repeats_once(self):
+        t = SeenNodesTracker()
+        assert t.update_many((0xAA, 0xAA), -80, 20, now_ms=100) == 1
+        assert t.get_by_hash(0xAA).pkt_count == 1
+        assert t.update_many((0xAA, 0xBB), -70, 24, now_ms=200) == 1
+        assert t.get_by_hash(0xAA).pkt_count == 2
+        assert t.get_by_hash(0xBB).last_seen == 200
+
+    def test_clear(self):
+        t = SeenNodesTracker()
+        t.update(0xAA, -80, 20, now_ms=0)
+        t.clear()
+        assert t.nodes == []
+        assert t.get_by_hash(0xAA) is None
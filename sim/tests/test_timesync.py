@@ -2,7 +2,8 @@
 
 import pytest
 from sim.clock import VirtualClock
-from sim.advert import TimeSync
+from sim.advert import TimeSync, AdvertTemplate, build_advert, parse_advert
+from sim.identity import Identity
 
 
 class TestTimeSync:
@@ -25,6 +26,19 @@ class TestTimeSync:
         result = ts.sync_from_advert(1_700_000_005)  # 5 seconds later, matches
         assert result == 0  # no change (within tolerance)
 
+    def test_timestamp_ticks_on_second_boundary(self):
+        clock = VirtualClock()
+        clock.advance(250)
+        ts = TimeSync(clock)
+        ts.set_time(1_700_000_000)
+
+        clock.advance(999)
+        assert ts.get_timestamp() == 1_700_000_000
+        clock.advance(1)
+        assert ts.get_timestamp() == 1_700_000_001
+        ts.set_time(1_800_000_000)  # rebase invalidates the cached second
+        assert ts.get_timestamp() == 1_800_000_000
+
     def test_invalid_timestamp_ignored(self):
         clock = VirtualClock()
         ts = TimeSync(clock)
@@ -64,6 +78,26 @@ class TestTimeSync:
         assert ts.is_synchronized()
         assert ts.get_timestamp() == 1_700_000_000
 
+    def test_advert_template_patches_timestamp(self):
+        clock = VirtualClock()
+        ts = TimeSync(clock)
+        ts.set_time(1_700_000_000)
+        ident = Identity("Tpl")
+        ident.flags = 0x81  # chat node + has name
+        tpl = AdvertTemplate(ident)
+
+        p1 = build_advert(ident, ts, template=tpl).payload
+        assert build_advert(ident, ts, template=tpl).payload is p1  # same second
+        assert p1 == build_advert(ident, ts).payload
+
+        clock.advance(1000)
+        p2 = build_advert(ident, ts, template=tpl).payload
+        assert parse_advert(p2).timestamp == 1_700_000_001
+        assert p2 == build_advert(ident, ts).payload
+
+        ident.name = "Renamed"  # appdata change rebuilds the template
+        assert parse_advert(build_advert(ident, ts, template=tpl).payload).name == "Renamed"
+
     def test_advert_propagates_time(self):
         """Test time sync through ADVERT in runner."""
         from sim.runner import SimRunner